@@ -6,19 +6,22 @@ Claude Agent SDKを使用してユーザー操作をテストし、動作確認
 """
 
 import asyncio
+import functools
+import hashlib
+import io
+import itertools
+import json
 import sys
 import os
+import re
+import shutil
+import subprocess
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-try:
-    from claude_agent_sdk import query, ClaudeAgentOptions, AssistantMessage, ResultMessage
-except ImportError:
-    print("Error: claude-agent-sdk is not installed.")
-    print("Install with: pip install claude-agent-sdk")
-    sys.exit(1)
-
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -26,9 +29,54 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# claude_agent_sdk は起動が重いため、--list/--issues では読み込まず初回使用時に読み込む
+_SDK = None
+
+
+def _sdk():
+    """claude_agent_sdk モジュールを返す（未インストールなら終了）"""
+    global _SDK
+    if _SDK is None:
+        try:
+            import claude_agent_sdk
+        except ImportError:
+            print("Error: claude-agent-sdk is not installed.")
+            print("Install with: pip install claude-agent-sdk")
+            sys.exit(1)
+        _SDK = claude_agent_sdk
+    return _SDK
+
+
 # プロジェクトルート
 PROJECT_ROOT = Path("D:/UrawaCup")
 ISSUES_FILE = PROJECT_ROOT / "ISSUES.md"
+CACHE_DIR = Path(__file__).resolve().parent / ".agent_check_cache"
+# キャッシュキーに含める作業ツリーの範囲（シナリオが確認するソース）
+# ISSUES.md などテスト実行のたびに書き換わるファイルを含めるとキーが毎回変わるため対象外とする
+FINGERPRINT_PATHS = ("src",)
+
+# 同時実行するテスト数のデフォルト値
+DEFAULT_JOBS = 4
+
+# --fast 時に直接実行するコマンドのタイムアウト（秒）
+DIRECT_CMD_TIMEOUT = 10
+
+# 応答判定用キーワード（英字は小文字で定義し、大文字小文字を区別せず照合）
+ERROR_KEYWORDS = frozenset(["error", "failed", "失敗", "エラー", "問題", "不明", "見つかりません"])
+QUESTION_KEYWORDS = frozenset(["不明", "わからない", "確認が必要", "要調査"])
+BUG_KEYWORDS = frozenset(["error", "エラー"])  # エラー検出時にBUGとして分類するキーワード
+# 全キーワードを1つの正規表現にまとめ、応答を1回だけ走査する
+# re.IGNORECASE により応答全体の小文字コピーを作らずに照合できる
+KEYWORD_RE = re.compile("|".join(
+    re.escape(k) for k in sorted(ERROR_KEYWORDS | QUESTION_KEYWORDS, key=len, reverse=True)
+), re.IGNORECASE)
+
+# 確認手順が互いに独立しているシナリオに付与する指示
+# SDKは1メッセージ内の複数ツール呼び出しを並列に処理するため、逐次実行より待ち時間が短くなる
+PARALLEL_HINT = """
+重要: 上記の検索・ファイル読み込みは互いに独立しているため、
+1つのメッセージでまとめてツールを呼び出し、並列に実行してください。
+"""
 
 # テストシナリオ定義（プロジェクト要件に特化）
 # FinalDay_Logic_Final.md と Report_PDF_Specification.md に基づく
@@ -43,6 +91,7 @@ curl http://localhost:8000/api/docs にアクセスしてレスポンスを確
 結果を報告（成功/失敗）
 """,
         "tools": ["Bash"],
+        "direct_cmds": [["curl", "-sS", "-f", "-o", os.devnull, "http://localhost:8000/api/docs"]],
         "category": "infrastructure"
     },
     {
@@ -68,6 +117,7 @@ cd D:/UrawaCup/src/frontend && npm run build 2>&1 | head -30
 結果を報告
 """,
         "tools": ["Bash"],
+        "requires": ["T001"],
         "category": "final-day"
     },
     {
@@ -81,6 +131,7 @@ cd D:/UrawaCup/src/frontend && npm run build 2>&1 | head -30
 問題があれば詳細を報告
 """,
         "tools": ["Bash"],
+        "requires": ["T001"],
         "category": "final-day"
     },
     {
@@ -118,7 +169,7 @@ D:/UrawaCup/src/backend/routes/matches.py を読んで以下を確認：
 2. FinalDaySchedule.tsx で再戦警告表示があるか確認
 3. MatchRow.tsx の isRematch プロップが使われているか確認
 問題があれば報告
-""",
+""" + PARALLEL_HINT,
         "tools": ["Grep", "Read"],
         "category": "final-day"
     },
@@ -132,7 +183,9 @@ D:/UrawaCup/src/backend/routes/matches.py を読んで以下を確認：
 3. バックエンドで manager_team_id の更新が可能か
 問題があれば報告
 """,
+        # PYTHON_EXECUTORS で判定するためSDKには送らない。prompt/tools は確認内容と --list 表示用
         "tools": ["Read", "Grep"],
+        "executor": "python",
         "category": "final-day"
     },
     {
@@ -144,7 +197,7 @@ D:/UrawaCup/src/backend/routes/matches.py を読んで以下を確認：
 2. FinalDaySchedule.tsx に handleUpdateBracket 関数があるか
 3. 準決勝勝者→決勝、敗者→3決 のロジックがあるか
 問題があれば報告
-""",
+""" + PARALLEL_HINT,
         "tools": ["Grep", "Read"],
         "category": "final-day"
     },
@@ -157,7 +210,7 @@ D:/UrawaCup/src/backend/routes/matches.py を読んで以下を確認：
 2. MatchSchedule.tsx で同様の実装があるか
 3. 重複API呼び出しを防止するロジックを確認
 問題があれば報告
-""",
+""" + PARALLEL_HINT,
         "tools": ["Grep", "Read"],
         "category": "final-day"
     },
@@ -173,6 +226,7 @@ PDF報告書生成APIを確認：
 問題があれば報告
 """,
         "tools": ["Bash"],
+        "requires": ["T001"],
         "category": "report"
     },
     {
@@ -226,6 +280,7 @@ PDF出力の仕様を確認（Report_PDF_Specification.md準拠）：
 問題があれば報告
 """,
         "tools": ["Bash"],
+        "requires": ["T001"],
         "category": "data"
     },
     {
@@ -239,88 +294,116 @@ PDF出力の仕様を確認（Report_PDF_Specification.md準拠）：
 問題があれば報告
 """,
         "tools": ["Bash"],
+        "requires": ["T001"],
         "category": "data"
     },
 ]
 
+# カテゴリ → シナリオ一覧の索引（定義順を保持）
+# ツール構成はソート済みタプルに正規化し、ClaudeAgentOptions の共有キーとして使う
+CATEGORY_INDEX: dict[str, list[dict]] = {}
+for _scenario in TEST_SCENARIOS:
+    _scenario["tools"] = tuple(sorted(_scenario["tools"]))
+    CATEGORY_INDEX.setdefault(_scenario["category"], []).append(_scenario)
+del _scenario
+
 
+@dataclass(slots=True)
 class TestResult:
     """テスト結果を格納するクラス"""
-    def __init__(self, test_id: str, name: str, category: str):
-        self.test_id = test_id
-        self.name = name
-        self.category = category
-        self.status: Optional[str] = None  # "PASS", "FAIL", "ERROR"
-        self.message: str = ""
-        self.issues: list[str] = []  # 発見された問題
-        self.duration: float = 0.0
+    test_id: str
+    name: str
+    category: str
+    status: Optional[str] = None  # "PASS", "FAIL", "ERROR"
+    message: str = ""
+    issues: list[str] = field(default_factory=list)  # 発見された問題
+    duration: float = 0.0
+
+
+@dataclass(slots=True, frozen=True)
+class Issue:
+    """記録されたイシュー"""
+    timestamp: str
+    test_id: str
+    test_name: str
+    category: str
+    issue_type: str  # "BUG", "QUESTION", "IMPROVEMENT", "ERROR"
+    description: str
+    details: str = ""
+
+
+ISSUE_ICONS = {
+    "BUG": "🐛",
+    "QUESTION": "❓",
+    "IMPROVEMENT": "💡",
+    "ERROR": "❌",
+    "SKIP": "⏭️"
+}
+
+ISSUES_HEADER = """# UrawaCup - Issues & Questions
+
+このファイルはagent-Checkによって自動生成されます。
+テスト実行中に発見された問題や不明点を記録します。
+
+"""
 
 
 class IssueTracker:
     """イシュー追跡クラス"""
     def __init__(self, issues_file: Path):
         self.issues_file = issues_file
-        self.issues: list[dict] = []
+        self.issues: list[Issue] = []
+        self.flushed_count = 0  # ファイルに書き込み済みのイシュー数
 
     def add_issue(self, test_id: str, test_name: str, category: str,
                   issue_type: str, description: str, details: str = ""):
         """イシューを追加"""
-        self.issues.append({
-            "timestamp": datetime.now().isoformat(),
-            "test_id": test_id,
-            "test_name": test_name,
-            "category": category,
-            "type": issue_type,  # "BUG", "QUESTION", "IMPROVEMENT"
-            "description": description,
-            "details": details
-        })
+        self.issues.append(Issue(
+            timestamp=datetime.now().isoformat(),
+            test_id=test_id,
+            test_name=test_name,
+            category=category,
+            issue_type=issue_type,
+            description=description,
+            details=details
+        ))
 
     def save(self):
-        """イシューをファイルに保存"""
-        if not self.issues:
-            return
+        """未保存のイシューをファイルに追記
 
-        # 既存の内容を読み込み
-        existing_content = ""
-        if self.issues_file.exists():
-            existing_content = self.issues_file.read_text(encoding="utf-8")
+        既存内容は読み込まずに追記のみ行う。通常終了時と中断時の両方で呼ばれても
+        同じイシューを二重に書き込まないよう、書き込み済みの件数を保持する。
+        """
+        pending = self.issues[self.flushed_count:]
+        if not pending:
+            return
 
         # 新しいイシューを追加
-        new_section = f"\n\n## テスト実行: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        parts = [f"\n\n## テスト実行: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"]
 
-        for issue in self.issues:
-            icon = {
-                "BUG": "🐛",
-                "QUESTION": "❓",
-                "IMPROVEMENT": "💡",
-                "ERROR": "❌"
-            }.get(issue["type"], "📝")
+        for issue in pending:
+            icon = ISSUE_ICONS.get(issue.issue_type, "📝")
 
-            new_section += f"""### {icon} [{issue['test_id']}] {issue['description']}
+            parts.append(f"""### {icon} [{issue.test_id}] {issue.description}
 
-- **カテゴリ**: {issue['category']}
-- **テスト**: {issue['test_name']}
-- **タイプ**: {issue['type']}
-- **検出日時**: {issue['timestamp']}
+- **カテゴリ**: {issue.category}
+- **テスト**: {issue.test_name}
+- **タイプ**: {issue.issue_type}
+- **検出日時**: {issue.timestamp}
 
-{issue['details']}
+{issue.details}
 
 ---
 
-"""
-
-        # ファイルに書き込み
-        if not existing_content:
-            header = """# UrawaCup - Issues & Questions
+""")
+        new_section = "".join(parts)
 
-このファイルはagent-Checkによって自動生成されます。
-テスト実行中に発見された問題や不明点を記録します。
-
-"""
-            existing_content = header
-
-        with open(self.issues_file, "w", encoding="utf-8") as f:
-            f.write(existing_content + new_section)
+        # ファイルに追記（新規・空ファイルの場合のみヘッダーを書き込む）
+        with open(self.issues_file, "a", encoding="utf-8", buffering=64 * 1024) as f:
+            if f.tell() == 0:
+                f.write(ISSUES_HEADER)
+            f.write(new_section)
+        self.flushed_count += len(pending)
 
         console.print(f"[yellow]イシューを記録しました: {self.issues_file}[/yellow]")
 
@@ -329,124 +412,712 @@ class IssueTracker:
 issue_tracker = IssueTracker(ISSUES_FILE)
 
 
-async def run_single_test(scenario: dict, results: list[TestResult]) -> TestResult:
-    """単一のテストシナリオを実行"""
+class ResultCache:
+    """SDKクエリ結果のディスクキャッシュ
+
+    読み取り専用ツールのみを使うシナリオは作業ツリーが変わらなければ結果も変わらないため、
+    (プロンプト, ツール, git HEAD, FINGERPRINT_PATHS 配下の未コミット差分・未追跡ファイル) の
+    SHA-256をキーに応答を保存して再利用する。
+    Bashを使うシナリオは稼働中のサーバー状態に依存するためキャッシュしない。
+    """
+    CACHEABLE_TOOLS = frozenset({"Read", "Grep", "Glob"})
+
+    def __init__(self, cache_dir: Path, max_entries: int = 256):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.enabled = True
+        self._fingerprint: Optional[str] = None
+
+    def _tree_fingerprint(self) -> str:
+        """作業ツリーの状態を表す文字列（取得できなければ空文字）"""
+        if self._fingerprint is None:
+            try:
+                head = subprocess.check_output(
+                    ["git", "-C", str(PROJECT_ROOT), "rev-parse", "HEAD"],
+                    stderr=subprocess.DEVNULL
+                )
+                diff = subprocess.check_output(
+                    ["git", "-C", str(PROJECT_ROOT), "diff", "HEAD", "--", *FINGERPRINT_PATHS],
+                    stderr=subprocess.DEVNULL
+                )
+                # 未追跡ファイルは git diff に現れないため、パスと内容もハッシュに含める
+                untracked = subprocess.check_output(
+                    ["git", "-C", str(PROJECT_ROOT), "ls-files", "--others", "--exclude-standard", "-z",
+                     "--", *FINGERPRINT_PATHS],
+                    stderr=subprocess.DEVNULL
+                )
+                digest = hashlib.sha256(diff)
+                for name in sorted(filter(None, untracked.split(b"\0"))):
+                    digest.update(b"\0" + name + b"\0")
+                    try:
+                        digest.update((PROJECT_ROOT / os.fsdecode(name)).read_bytes())
+                    except OSError:
+                        pass
+                self._fingerprint = head.decode().strip() + digest.hexdigest()
+            except (OSError, subprocess.CalledProcessError):
+                self._fingerprint = ""
+        return self._fingerprint
+
+    def key(self, prompt: str, tools: tuple[str, ...]) -> Optional[str]:
+        """キャッシュキーを返す（キャッシュ対象外ならNone）"""
+        if not self.enabled or not set(tools) <= self.CACHEABLE_TOOLS:
+            return None
+        fingerprint = self._tree_fingerprint()
+        if not fingerprint:
+            return None
+        payload = prompt + json.dumps(tools) + fingerprint
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[tuple[Optional[str], str]]:
+        """キャッシュ済みの (SDK判定ステータス, 応答テキスト) を返す"""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        os.utime(path)  # LRU用にアクセス時刻を更新
+        return data["sdk_status"], data["text"]
+
+    def put(self, key: str, sdk_status: Optional[str], text: str):
+        """応答をアトミックに書き込み、上限を超えたら古いものから削除"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"sdk_status": sdk_status, "text": text}, ensure_ascii=False),
+                       encoding="utf-8")
+        os.replace(tmp, path)
+        self._evict()
+
+    def _evict(self):
+        entries = list(self.cache_dir.glob("*.json"))
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=os.path.getatime)
+        for path in entries[:len(entries) - self.max_entries]:
+            path.unlink(missing_ok=True)
+
+    def build_key(self, lockfile: Path) -> Optional[str]:
+        """フロントエンドビルド結果のキャッシュキーを返す（キャッシュ対象外ならNone）"""
+        if not self.enabled:
+            return None
+        fingerprint = self._tree_fingerprint()
+        if not fingerprint:
+            return None
+        try:
+            lock_mtime = lockfile.stat().st_mtime_ns
+        except OSError:
+            lock_mtime = 0
+        payload = f"npm-build:{fingerprint}:{lock_mtime}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def invalidate(self):
+        """キャッシュを全削除"""
+        if self.cache_dir.exists():
+            shutil.rmtree(self.cache_dir)
+
+
+# グローバル結果キャッシュ
+result_cache = ResultCache(CACHE_DIR)
+
+
+def _scan_keywords(text: str) -> set[str]:
+    """テキスト中に出現する判定キーワードの集合を返す"""
+    return {m.group(0).lower() for m in KEYWORD_RE.finditer(text)}
+
+
+@functools.lru_cache(maxsize=None)
+def _options(tools: tuple[str, ...]):
+    """ツール構成ごとに ClaudeAgentOptions を1つだけ生成して使い回す"""
+    return _sdk().ClaudeAgentOptions(
+        allowed_tools=list(tools),
+        max_turns=15,
+    )
+
+
+async def _run_query(prompt: str, tools: tuple[str, ...]) -> tuple[Optional[str], str, set[str]]:
+    """SDKクエリを実行し、(SDK判定ステータス, アシスタント応答テキスト, 検出キーワード) を返す
+
+    キーワードはテキストブロック受信ごとに走査するため、応答全体を改めて走査しない。
+    """
+    cache_key = result_cache.key(prompt, tools)
+    if cache_key:
+        cached = result_cache.get(cache_key)
+        if cached:
+            sdk_status, text = cached
+            return sdk_status, text, _scan_keywords(text)
+
+    sdk = _sdk()
+    sdk_status: Optional[str] = None
+    buf = io.StringIO()
+    hits: set[str] = set()
+
+    async for message in sdk.query(
+        prompt=prompt + "\n\n不明点や問題があれば、必ず報告してください。",
+        options=_options(tools)
+    ):
+        if isinstance(message, sdk.AssistantMessage):
+            for block in message.content:
+                if hasattr(block, "text"):
+                    if buf.tell():
+                        buf.write("\n")
+                    buf.write(block.text)
+                    hits |= _scan_keywords(block.text)
+        elif isinstance(message, sdk.ResultMessage):
+            if message.subtype == "success":
+                sdk_status = "PASS"
+            else:
+                sdk_status = "FAIL"
+
+    text = buf.getvalue()
+    if cache_key and sdk_status == "PASS":
+        result_cache.put(cache_key, sdk_status, text)
+    return sdk_status, text, hits
+
+
+def _classify(hits: set[str]) -> tuple[bool, bool]:
+    """検出キーワードから (エラーあり, 不明点あり) を判定"""
+    return not hits.isdisjoint(ERROR_KEYWORDS), not hits.isdisjoint(QUESTION_KEYWORDS)
+
+
+def _details_snippet(message: str) -> str:
+    """イシュー詳細に記録する応答の末尾1000文字を返す"""
+    return message if len(message) <= 1000 else message[-1000:]
+
+
+def _evaluate_response(result: TestResult, sdk_status: Optional[str], hits: set[str]):
+    """SDK判定と検出キーワードから最終ステータスを決め、必要ならイシューを記録
+
+    エラーキーワードがあればFAIL、なければSDKの判定（未取得ならPASS）を採用する。
+    """
+    has_error, has_question = _classify(hits)
+    result.status = "FAIL" if has_error else (sdk_status or "PASS")
+    details_snippet = _details_snippet(result.message)
+
+    if has_error:
+        # イシューを記録
+        issue_tracker.add_issue(
+            test_id=result.test_id,
+            test_name=result.name,
+            category=result.category,
+            issue_type="BUG" if not hits.isdisjoint(BUG_KEYWORDS) else "QUESTION",
+            description=f"{result.name}で問題を検出",
+            details=details_snippet
+        )
+
+    # 不明点キーワードの検出
+    if has_question:
+        issue_tracker.add_issue(
+            test_id=result.test_id,
+            test_name=result.name,
+            category=result.category,
+            issue_type="QUESTION",
+            description=f"{result.name}で不明点を検出",
+            details=details_snippet
+        )
+
+
+def _record_error(result: TestResult, e: Exception):
+    """実行時例外をテスト結果とイシューに反映"""
+    result.status = "ERROR"
+    result.message = str(e)
+    issue_tracker.add_issue(
+        test_id=result.test_id,
+        test_name=result.name,
+        category=result.category,
+        issue_type="ERROR",
+        description=f"{result.name}で実行エラー",
+        details=str(e)
+    )
+
+
+async def _run_direct_cmds(cmds: list[list[str]],
+                           timeout: float) -> Optional[tuple[str, str]]:
+    """コマンドをSDKを介さず直接並列実行し、(ステータス, 出力) を返す
+
+    終了コードが全て0ならPASS、それ以外（タイムアウト含む）はFAIL。
+    コマンドを起動できない場合はNoneを返し、呼び出し側でSDK経由の実行に切り替える。
+    """
+    async def _one(cmd: list[str]) -> tuple[bool, str]:
+        # Windowsの npm.cmd 等も解決できるよう実行ファイルのパスを探す
+        argv = [shutil.which(cmd[0]) or cmd[0], *cmd[1:]]
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT
+        )
+        try:
+            out, _ = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return False, f"$ {' '.join(cmd)}\n{timeout:.0f}秒以内に終了しませんでした"
+        text = out.decode("utf-8", errors="replace").strip()
+        return proc.returncode == 0, f"$ {' '.join(cmd)}\n(exit {proc.returncode})\n{text}"
+
+    try:
+        outcomes = await asyncio.gather(*[_one(cmd) for cmd in cmds])
+    except OSError:
+        return None
+
+    status = "PASS" if all(ok for ok, _ in outcomes) else "FAIL"
+    return status, "\n\n".join(output for _, output in outcomes)
+
+
+FRONTEND_DIR = PROJECT_ROOT / "src" / "frontend"
+BUILD_TIMEOUT = 300  # npm run build のタイムアウト（秒）
+_BUILD_TASK: Optional[asyncio.Task] = None
+
+
+async def _run_frontend_build() -> Optional[tuple[str, str]]:
+    """npm run build を実行し (ステータス, 出力) を返す（起動できなければNone）
+
+    成功したビルド結果は git HEAD・未コミット差分・package-lock.json の更新時刻をキーに
+    キャッシュし、フロントエンドが変わっていなければ再ビルドしない。
+    """
+    cache_key = result_cache.build_key(FRONTEND_DIR / "package-lock.json")
+    if cache_key:
+        cached = result_cache.get(cache_key)
+        if cached:
+            return cached
+
+    build = await _run_direct_cmds(
+        [["npm", "--prefix", str(FRONTEND_DIR), "run", "build"]], BUILD_TIMEOUT
+    )
+    if cache_key and build and build[0] == "PASS":
+        result_cache.put(cache_key, *build)
+    return build
+
+
+def _frontend_build() -> asyncio.Task:
+    """フロントエンドビルドを1回だけ実行するタスクを返す（ビルド出力を使う全テストで共有）"""
+    global _BUILD_TASK
+    if _BUILD_TASK is None:
+        _BUILD_TASK = asyncio.ensure_future(_run_frontend_build())
+    return _BUILD_TASK
+
+
+def _check_build_success(status: str, output: str) -> tuple[str, str]:
+    """ビルドの成否と TypeScript エラーの有無を判定"""
+    ts_errors = [line for line in output.splitlines() if "error TS" in line]
+    if status == "PASS" and not ts_errors:
+        return "PASS", output
+    summary = f"TypeScriptエラー: {len(ts_errors)}件\n" if ts_errors else ""
+    return "FAIL", summary + output
+
+
+# --fast 時に共有ビルド出力から結果を導出するテスト（テストID → 判定関数）
+BUILD_CHECKS = {
+    "T002": _check_build_success,
+}
+
+
+# T008: 会場担当（managerTeamId）機能の確認項目 (PROJECT_ROOTからの相対パス, 検索パターン, 確認内容)
+T008_CHECKS = [
+    ("src/frontend/src/features/venues/types.ts", r"\bmanagerTeamId\b",
+     "types.ts で managerTeamId が定義されている"),
+    ("src/frontend/src/features/final-day/components/VenueCard.tsx", r"\bonManagerChange\b",
+     "VenueCard.tsx に会場担当の編集UIがある"),
+    ("src/backend/schemas/venue.py", r"\bmanager_team_id\b",
+     "バックエンドのスキーマで manager_team_id を更新できる"),
+]
+
+
+def _check_file_patterns(checks: list[tuple[str, str, str]]) -> tuple[str, str]:
+    """ファイル内のパターン有無を確認し、(ステータス, 結果メッセージ) を返す"""
+    contents: dict[str, Optional[str]] = {}
+    lines = []
+    for rel_path, pattern, label in checks:
+        if rel_path not in contents:
+            try:
+                contents[rel_path] = (PROJECT_ROOT / rel_path).read_text(encoding="utf-8")
+            except OSError:
+                contents[rel_path] = None
+        text = contents[rel_path]
+        if text is None:
+            lines.append(f"NG: {label}（{rel_path} が見つかりません）")
+        elif re.search(pattern, text):
+            lines.append(f"OK: {label}")
+        else:
+            lines.append(f"NG: {label}（{rel_path} に {pattern} がありません）")
+
+    status = "FAIL" if any(line.startswith("NG") for line in lines) else "PASS"
+    return status, "\n".join(lines)
+
+
+# "executor": "python" のシナリオをSDKを使わずに判定する関数（テストID → 関数）
+PYTHON_EXECUTORS = {
+    "T008": lambda: _check_file_patterns(T008_CHECKS),
+}
+
+
+def _runs_without_sdk(scenario: dict, fast: bool) -> bool:
+    """シナリオをSDKを使わずに実行するか"""
+    return scenario.get("executor") == "python" or (
+        fast and ("direct_cmds" in scenario or scenario["id"] in BUILD_CHECKS)
+    )
+
+
+async def run_single_test(scenario: dict, fast: bool = False) -> TestResult:
+    """単一のテストシナリオを実行
+
+    "executor": "python" のシナリオは登録済みの関数で判定し、
+    fast=True のときは direct_cmds のコマンド実行結果、または BUILD_CHECKS に登録された
+    テストは共有ビルド出力から判定する（いずれもSDKを起動しない）。
+    """
     result = TestResult(
         test_id=scenario["id"],
         name=scenario["name"],
         category=scenario["category"]
     )
 
-    start_time = datetime.now()
-    full_response = []
+    start = time.perf_counter()
 
     try:
-        async for message in query(
-            prompt=scenario["prompt"] + "\n\n不明点や問題があれば、必ず報告してください。",
-            options=ClaudeAgentOptions(
-                allowed_tools=scenario["tools"],
-                max_turns=15,
-            )
-        ):
-            if isinstance(message, AssistantMessage):
-                for block in message.content:
-                    if hasattr(block, "text"):
-                        full_response.append(block.text)
-            elif isinstance(message, ResultMessage):
-                if message.subtype == "success":
-                    result.status = "PASS"
-                else:
-                    result.status = "FAIL"
-
-        result.message = "\n".join(full_response)
-
-        # レスポンスから成功/失敗を判定
-        response_text = result.message.lower()
-
-        # エラーキーワードの検出
-        error_keywords = ["error", "failed", "失敗", "エラー", "問題", "不明", "見つかりません"]
-        has_error = any(keyword in response_text for keyword in error_keywords)
-
-        if has_error:
-            result.status = "FAIL"
-            # イシューを記録
-            issue_tracker.add_issue(
-                test_id=result.test_id,
-                test_name=result.name,
-                category=result.category,
-                issue_type="BUG" if "error" in response_text or "エラー" in response_text else "QUESTION",
-                description=f"{result.name}で問題を検出",
-                details=result.message[-1000:] if len(result.message) > 1000 else result.message
-            )
-        elif result.status is None:
-            result.status = "PASS"
-
-        # 不明点キーワードの検出
-        question_keywords = ["不明", "わからない", "確認が必要", "要調査"]
-        if any(keyword in response_text for keyword in question_keywords):
-            issue_tracker.add_issue(
-                test_id=result.test_id,
-                test_name=result.name,
-                category=result.category,
-                issue_type="QUESTION",
-                description=f"{result.name}で不明点を検出",
-                details=result.message[-1000:] if len(result.message) > 1000 else result.message
+        outcome = None
+        if scenario.get("executor") == "python":
+            outcome = PYTHON_EXECUTORS[scenario["id"]]()
+        elif fast and "direct_cmds" in scenario:
+            outcome = await _run_direct_cmds(
+                scenario["direct_cmds"], scenario.get("direct_timeout", DIRECT_CMD_TIMEOUT)
             )
+        elif fast and scenario["id"] in BUILD_CHECKS:
+            build = await _frontend_build()
+            if build:
+                outcome = BUILD_CHECKS[scenario["id"]](*build)
+        if outcome:
+            result.status, result.message = outcome
+            if result.status == "FAIL":
+                issue_tracker.add_issue(
+                    test_id=result.test_id,
+                    test_name=result.name,
+                    category=result.category,
+                    issue_type="BUG",
+                    description=f"{result.name}で問題を検出",
+                    details=_details_snippet(result.message)
+                )
+        else:
+            sdk_status, result.message, hits = await _run_query(scenario["prompt"], scenario["tools"])
+            _evaluate_response(result, sdk_status, hits)
+    except Exception as e:
+        _record_error(result, e)
+
+    result.duration = time.perf_counter() - start
+    return result
+
+
+# 統合クエリの応答を「### T0xx」見出しで分割する
+FUSED_SECTION_RE = re.compile(r"^#{2,4}\s*\[?(T\d{3})\]?", re.MULTILINE)
+
+
+def fuse_scenarios_by_category(scenarios: list[dict]) -> list[dict]:
+    """同一カテゴリかつ同一ツール構成のシナリオを1つのクエリにまとめる
+
+    SDKの起動コストをカテゴリ内のシナリオで共有するため。
+    ツール構成が異なるシナリオは allowed_tools を最小に保つため別グループにする。
+    単独のシナリオはそのまま返す。
+    """
+    groups: dict[tuple[str, tuple[str, ...]], list[dict]] = {}
+    for scenario in scenarios:
+        key = (scenario["category"], scenario["tools"])
+        groups.setdefault(key, []).append(scenario)
+
+    fused = []
+    for (category, tools), members in groups.items():
+        if len(members) == 1:
+            fused.append(members[0])
+            continue
+
+        ids = [m["id"] for m in members]
+        parts = [f"=== {m['id']}: {m['name']} ===\n{m['prompt'].strip()}\n\n" for m in members]
+        parts.append(
+            "上記の各テストを実施し、テストIDごとに `### T0xx` で始まるセクションを"
+            "1つずつ作成して回答してください（例: `### " + ids[0] + "`）。"
+        )
+        fused.append({
+            "id": "+".join(ids),
+            "name": f"{category} ({len(members)}件統合)",
+            "prompt": "".join(parts),
+            "tools": tools,
+            "category": category,
+            "members": members,
+        })
+    return fused
+
+
+def split_fused_response(text: str) -> dict[str, str]:
+    """統合クエリの応答をテストIDごとのセクションに分割"""
+    sections: dict[str, str] = {}
+    matches = list(FUSED_SECTION_RE.finditer(text))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        sections[match.group(1)] = text[match.end():end].strip()
+    return sections
 
+
+async def run_fused_test(fused: dict) -> list[TestResult]:
+    """統合シナリオを1回のクエリで実行し、シナリオごとの結果に分解"""
+    results = [
+        TestResult(test_id=m["id"], name=m["name"], category=m["category"])
+        for m in fused["members"]
+    ]
+
+    start = time.perf_counter()
+
+    try:
+        sdk_status, text, _ = await _run_query(fused["prompt"], fused["tools"])
+        sections = split_fused_response(text)
+        for result in results:
+            if result.test_id in sections:
+                result.message = sections[result.test_id]
+                _evaluate_response(result, sdk_status, _scan_keywords(result.message))
+            else:
+                _record_error(result, RuntimeError(f"統合応答に {result.test_id} のセクションがありません"))
     except Exception as e:
-        result.status = "ERROR"
-        result.message = str(e)
-        issue_tracker.add_issue(
-            test_id=result.test_id,
-            test_name=result.name,
-            category=result.category,
-            issue_type="ERROR",
-            description=f"{result.name}で実行エラー",
-            details=str(e)
+        for result in results:
+            _record_error(result, e)
+
+    # 共有クエリの所要時間を各結果に記録
+    duration = time.perf_counter() - start
+    for result in results:
+        result.duration = duration
+    return results
+
+
+# rg 1回でまとめて検索する grep 系シナリオのパターン（テストID → (パターン, PROJECT_ROOTからの検索対象)）
+# 検索結果はプロンプトに埋め込み、エージェント側での再検索を省く
+RIPGREP_PATTERNS: dict[str, tuple[str, list[str]]] = {
+    "T006": (r"distributeTeams|team.*distribution", ["src/backend"]),
+    "T007": (r"check.*played|rematch", ["src/backend", "src/frontend/src"]),
+    "T009": (r"update.*bracket|finals.*bracket", ["src/backend", "src/frontend/src"]),
+    "T010": (r"swappingRef", ["src/frontend/src"]),
+}
+PRESCAN_MAX_LINES = 30  # 1テストあたりプロンプトに埋め込む最大行数
+
+
+def _partition_rg_output(output: bytes, test_ids: list[str]) -> dict[str, list[str]]:
+    """rg --json の出力を、マッチしたパターンのテストIDごとに振り分ける"""
+    targets = {
+        tid: (re.compile(RIPGREP_PATTERNS[tid][0], re.IGNORECASE),
+              [PROJECT_ROOT / d for d in RIPGREP_PATTERNS[tid][1]])
+        for tid in test_ids
+    }
+    hits: dict[str, list[str]] = {tid: [] for tid in test_ids}
+    for raw in output.splitlines():
+        event = json.loads(raw)
+        if event["type"] != "match":
+            continue
+        data = event["data"]
+        path = Path(data["path"].get("text", ""))
+        line = data["lines"].get("text", "").strip()
+        for tid, (regex, roots) in targets.items():
+            if any(path.is_relative_to(root) for root in roots) and regex.search(line):
+                rel = path.relative_to(PROJECT_ROOT).as_posix()
+                hits[tid].append(f"{rel}:{data['line_number']}: {line}")
+    return hits
+
+
+async def prescan_patterns(test_ids: list[str]) -> dict[str, str]:
+    """RIPGREP_PATTERNS を1回の rg 実行で検索し、テストIDごとの検索結果テキストを返す
+
+    rg が無い・失敗した場合は空の辞書を返す（各エージェントが従来どおり自分で検索する）。
+    """
+    test_ids = [tid for tid in test_ids if tid in RIPGREP_PATTERNS]
+    rg = shutil.which("rg")
+    if not test_ids or not rg:
+        return {}
+
+    args = [rg, "--json", "--ignore-case", "--glob", "!node_modules"]
+    for tid in test_ids:
+        args += ["-e", RIPGREP_PATTERNS[tid][0]]
+    roots = dict.fromkeys(d for tid in test_ids for d in RIPGREP_PATTERNS[tid][1])
+    args += [str(PROJECT_ROOT / d) for d in roots if (PROJECT_ROOT / d).exists()]
+
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
         )
+        output, _ = await proc.communicate()
+        if proc.returncode not in (0, 1):  # 1 はマッチなし
+            return {}
+        hits = _partition_rg_output(output, test_ids)
+    except (OSError, ValueError, KeyError):
+        return {}
+
+    prescan = {}
+    for tid, lines in hits.items():
+        if len(lines) > PRESCAN_MAX_LINES:
+            lines = lines[:PRESCAN_MAX_LINES] + [f"...（他 {len(lines) - PRESCAN_MAX_LINES} 件）"]
+        prescan[tid] = "\n".join(lines) or "（該当なし）"
+    return prescan
+
+
+def _with_prescan(scenario: dict, prescan: dict[str, str]) -> dict:
+    """事前検索結果をプロンプトに追記したシナリオを返す"""
+    if scenario["id"] not in prescan:
+        return scenario
+    pattern = RIPGREP_PATTERNS[scenario["id"]][0]
+    return {
+        **scenario,
+        "prompt": scenario["prompt"]
+        + f"\n事前検索結果（パターン: {pattern}、大文字小文字を区別しない）:\n"
+        + prescan[scenario["id"]]
+        + "\nこの検索は実施済みのため、同じパターンでの再検索は不要です。\n"
+    }
+
+
+def plan_waves(scenarios: list[dict]) -> list[list[dict]]:
+    """requires（前提テスト）に従ってシナリオを実行ウェーブに分割
+
+    各シナリオは前提テストより後のウェーブに配置される。
+    選択されていない前提テストは無視する。
+    """
+    by_id = {s["id"]: s for s in scenarios}
+    levels: dict[str, int] = {}
+
+    def _level(scenario: dict, visiting: frozenset[str] = frozenset()) -> int:
+        test_id = scenario["id"]
+        if test_id in levels:
+            return levels[test_id]
+        if test_id in visiting:
+            raise ValueError(f"前提テストが循環しています: {test_id}")
+        required = [by_id[r] for r in scenario.get("requires", ()) if r in by_id]
+        levels[test_id] = max(
+            (_level(r, visiting | {test_id}) + 1 for r in required), default=0
+        )
+        return levels[test_id]
 
-    result.duration = (datetime.now() - start_time).total_seconds()
-    results.append(result)
-    return result
+    waves: list[list[dict]] = []
+    for scenario in scenarios:
+        level = _level(scenario)
+        while len(waves) <= level:
+            waves.append([])
+        waves[level].append(scenario)
+    return waves
 
 
-async def run_all_tests(categories: Optional[list[str]] = None) -> list[TestResult]:
-    """全テストを実行"""
-    results: list[TestResult] = []
+def _skipped_result(scenario: dict, required_id: str) -> TestResult:
+    """前提テスト失敗によりスキップしたテスト結果"""
+    return TestResult(
+        test_id=scenario["id"],
+        name=scenario["name"],
+        category=scenario["category"],
+        status="SKIP",
+        message=f"前提テスト {required_id} が成功しなかったためスキップ"
+    )
+
 
+async def run_all_tests(categories: Optional[list[str]] = None,
+                        jobs: int = DEFAULT_JOBS,
+                        fuse: bool = False,
+                        fast: bool = False) -> list[TestResult]:
+    """全テストを実行（最大jobs件を並列実行）"""
     # カテゴリフィルタ
     scenarios = TEST_SCENARIOS
     if categories:
-        scenarios = [s for s in scenarios if s["category"] in categories]
+        unknown = [c for c in categories if c not in CATEGORY_INDEX]
+        if unknown:
+            raise ValueError(f"不明なカテゴリ: {', '.join(unknown)}")
+        scenarios = list(itertools.chain.from_iterable(
+            CATEGORY_INDEX[c] for c in dict.fromkeys(categories)
+        ))
 
     console.print(Panel.fit(
         f"[bold blue]UrawaCup操作テスト開始[/bold blue]\n"
-        f"テスト数: {len(scenarios)}\n"
+        f"テスト数: {len(scenarios)} (並列数: {jobs}"
+        f"{', 統合実行' if fuse else ''}{', コマンド直接実行' if fast else ''})\n"
         f"イシュー記録先: {ISSUES_FILE}",
         title="agent-Check"
     ))
 
+    # ビルド出力を使うテストがあれば、ビルドを1回だけ先行して開始しておく
+    if fast and any(s["id"] in BUILD_CHECKS for s in scenarios):
+        _frontend_build()
+
+    # grep 系シナリオの検索を rg 1回にまとめ、結果を各プロンプトに埋め込む
+    prescan = await prescan_patterns([s["id"] for s in scenarios if not _runs_without_sdk(s, fast)])
+    scenarios = [_with_prescan(s, prescan) for s in scenarios]
+
+    # 各テストはLLM/サブプロセス待ちが支配的なので、セマフォで同時実行数を制限して並列化
+    sem = asyncio.Semaphore(jobs)
+    selected_ids = {s["id"] for s in scenarios}
+    passed: set[str] = set()
+    unit_results: list[list[TestResult]] = []
+
+    status_icon = {
+        "PASS": "[green]✓[/green]",
+        "FAIL": "[red]✗[/red]",
+        "ERROR": "[yellow]![/yellow]",
+        "SKIP": "[dim]-[/dim]"
+    }
+
+    # 並列実行時の再描画コストを抑えるため、進捗は1行にまとめて再描画を4Hzに制限する
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console
+        TextColumn("{task.completed}/{task.total}"),
+        console=console,
+        refresh_per_second=4,
+        transient=True
     ) as progress:
-        for scenario in scenarios:
-            task = progress.add_task(
-                f"[cyan]{scenario['id']}[/cyan] {scenario['name']}...",
-                total=1
-            )
-
-            result = await run_single_test(scenario, results)
-
-            status_icon = {
-                "PASS": "[green]✓[/green]",
-                "FAIL": "[red]✗[/red]",
-                "ERROR": "[yellow]![/yellow]"
-            }.get(result.status, "?")
-
-            progress.update(task, description=f"{status_icon} {scenario['name']}")
-            progress.advance(task)
+        task = progress.add_task("テスト実行中...", total=len(scenarios))
+
+        def _report(rs: list[TestResult]):
+            for r in rs:
+                progress.update(
+                    task,
+                    advance=1,
+                    description=f"{status_icon.get(r.status, '?')} [cyan]{r.test_id}[/cyan] {r.name}"
+                )
+
+        async def _guarded(unit: dict) -> list[TestResult]:
+            async with sem:
+                if "members" in unit:
+                    rs = await run_fused_test(unit)
+                else:
+                    rs = [await run_single_test(unit, fast)]
+            _report(rs)
+            return rs
+
+        # 前提テストが先に完了するようウェーブ単位で実行し、ウェーブ内は並列実行
+        for wave in plan_waves(scenarios):
+            runnable = []
+            blocked: dict[str, list[dict]] = {}
+            for scenario in wave:
+                failed = [r for r in scenario.get("requires", ())
+                          if r in selected_ids and r not in passed]
+                if failed:
+                    blocked.setdefault(failed[0], []).append(scenario)
+                else:
+                    runnable.append(scenario)
+
+            # 前提テストが失敗していれば問い合わせずにSKIPとし、イシューは前提ごとに1件だけ記録
+            for required_id, skipped in blocked.items():
+                skipped_results = [_skipped_result(s, required_id) for s in skipped]
+                unit_results.append(skipped_results)
+                _report(skipped_results)
+                required = next(s for s in scenarios if s["id"] == required_id)
+                issue_tracker.add_issue(
+                    test_id=required_id,
+                    test_name=required["name"],
+                    category=required["category"],
+                    issue_type="SKIP",
+                    description=f"{required_id}の失敗により{len(skipped)}件のテストをスキップ",
+                    details=", ".join(f"{s['id']} {s['name']}" for s in skipped)
+                )
+
+            # SDKを使わないシナリオは統合せず、それ以外を統合対象にする
+            direct = [s for s in runnable if _runs_without_sdk(s, fast)]
+            queried = [s for s in runnable if not _runs_without_sdk(s, fast)]
+            units = direct + (fuse_scenarios_by_category(queried) if fuse else queried)
+            for rs in await asyncio.gather(*[_guarded(u) for u in units]):
+                unit_results.append(rs)
+                passed.update(r.test_id for r in rs if r.status == "PASS")
+
+    # 統合実行時もシナリオ定義順に並べ直す
+    order = {s["id"]: i for i, s in enumerate(scenarios)}
+    results = sorted((r for rs in unit_results for r in rs), key=lambda r: order[r.test_id])
 
     # イシューを保存
     issue_tracker.save()
@@ -465,19 +1136,23 @@ def print_results(results: list[TestResult]):
 
     pass_count = 0
     fail_count = 0
+    skip_count = 0
     error_count = 0
 
     for result in results:
         status_style = {
             "PASS": "[green]PASS[/green]",
             "FAIL": "[red]FAIL[/red]",
-            "ERROR": "[yellow]ERROR[/yellow]"
+            "ERROR": "[yellow]ERROR[/yellow]",
+            "SKIP": "[dim]SKIP[/dim]"
         }.get(result.status, result.status)
 
         if result.status == "PASS":
             pass_count += 1
         elif result.status == "FAIL":
             fail_count += 1
+        elif result.status == "SKIP":
+            skip_count += 1
         else:
             error_count += 1
 
@@ -496,6 +1171,7 @@ def print_results(results: list[TestResult]):
     console.print(Panel(
         f"[green]PASS: {pass_count}[/green] | "
         f"[red]FAIL: {fail_count}[/red] | "
+        f"[dim]SKIP: {skip_count}[/dim] | "
         f"[yellow]ERROR: {error_count}[/yellow] | "
         f"Total: {total}\n"
         f"Issues recorded: {len(issue_tracker.issues)}",
@@ -530,6 +1206,11 @@ def main():
   python agent_check.py                    # 全テスト実行（16件）
   python agent_check.py -c final-day       # 最終日関連のみ
   python agent_check.py -c report          # 報告書関連のみ
+  python agent_check.py -j 8               # 8並列で実行
+  python agent_check.py --fuse             # 同カテゴリのテストを1クエリに統合
+  python agent_check.py --fast             # curl/npmのみのテストはコマンドを直接実行
+  python agent_check.py --no-cache         # 結果キャッシュを使わずに実行
+  python agent_check.py --invalidate       # 結果キャッシュを削除してから実行
   python agent_check.py --list             # テスト一覧表示
 
 不明点や問題は D:/UrawaCup/ISSUES.md に自動記録されます。
@@ -538,8 +1219,38 @@ def main():
     parser.add_argument(
         "-c", "--category",
         nargs="+",
+        choices=list(CATEGORY_INDEX),
+        metavar="CATEGORY",
         help="テストするカテゴリを指定"
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        choices=range(1, 9),
+        default=DEFAULT_JOBS,
+        metavar="N",
+        help=f"同時実行するテスト数 (1-8, デフォルト: {DEFAULT_JOBS})"
+    )
+    parser.add_argument(
+        "--fuse",
+        action="store_true",
+        help="同一カテゴリ・同一ツール構成のテストを1クエリに統合して実行"
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="curl/npm のみのテストはSDKを使わずコマンドを直接実行（ビルドは1回だけ実行）"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="結果キャッシュを使わない（読み取り専用テストも毎回実行）"
+    )
+    parser.add_argument(
+        "--invalidate",
+        action="store_true",
+        help="結果キャッシュを削除してから実行"
+    )
     parser.add_argument(
         "--list",
         action="store_true",
@@ -578,9 +1289,14 @@ def main():
             console.print("[yellow]イシューファイルはまだありません[/yellow]")
         return
 
-    # テスト実行
+    if args.invalidate:
+        result_cache.invalidate()
+    result_cache.enabled = not args.no_cache
+
+    # テスト実行（SDKが無ければここで終了する）
+    _sdk()
     try:
-        results = asyncio.run(run_all_tests(args.category))
+        results = asyncio.run(run_all_tests(args.category, args.jobs, args.fuse, args.fast))
         print_results(results)
 
         # 失敗があれば終了コード1
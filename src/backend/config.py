@@ -21,6 +21,9 @@ class Settings(BaseSettings):
     # データベース設定
     database_url: str = "sqlite:///./urawa_cup.db"
     sql_echo: bool = False
+    # 接続プールの大きさ。同期ルートのスレッド数上限は両者の合計（AnyIOの既定値は40）
+    db_pool_size: int = 30
+    db_max_overflow: int = 20
     
     # 認証設定
     secret_key: str = "your-secret-key-change-in-production"
@@ -36,6 +39,10 @@ class Settings(BaseSettings):
     
     # 報告書出力設定
     report_output_dir: str = "./reports"
+
+    # PDF描画を行うプロセスプールのワーカー数
+    # 各ワーカーはアプリを読み込むためメモリを消費する。少数に抑える
+    render_workers: int = 2
     
     # 大会デフォルト設定
     default_match_duration: int = 50
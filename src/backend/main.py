@@ -3,11 +3,16 @@
 FastAPI + SQLAlchemy
 """
 
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from database import init_db
+from config import settings
+from database import DB_MAX_OVERFLOW, DB_POOL_SIZE, init_db
 from routes import api_router
 
 
@@ -16,11 +21,23 @@ async def lifespan(app: FastAPI):
     """アプリケーションのライフサイクル管理"""
     # 起動時の処理
     print("浦和カップ API サーバー起動中...")
+    # 同期ルートはスレッドプールで実行されるため、同時実行数の上限をDB接続数の上限に合わせる
+    # 接続数を超えたリクエストはプール取得のタイムアウトで失敗させず、スレッド待ちで順番を待たせる
+    anyio.to_thread.current_default_thread_limiter().total_tokens = DB_POOL_SIZE + DB_MAX_OVERFLOW
     init_db()
     print("データベース初期化完了")
-    yield
-    # 終了時の処理
-    print("浦和カップ API サーバー終了")
+    # PDF描画用のプロセスプール
+    # マルチスレッドのサーバープロセスをforkしないよう、spawnでワーカーを起動する
+    app.state.render_executor = ProcessPoolExecutor(
+        max_workers=settings.render_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+    try:
+        yield
+    finally:
+        # 終了時の処理
+        app.state.render_executor.shutdown(cancel_futures=True)
+        print("浦和カップ API サーバー終了")
 
 
 # FastAPIアプリケーション作成
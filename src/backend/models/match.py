@@ -142,7 +142,12 @@ class Match(Base, TimestampMixin):
     venue = relationship("Venue", back_populates="matches")
     home_team = relationship("Team", foreign_keys=[home_team_id], back_populates="home_matches")
     away_team = relationship("Team", foreign_keys=[away_team_id], back_populates="away_matches")
-    goals = relationship("Goal", back_populates="match", cascade="all, delete-orphan")
+    goals = relationship(
+        "Goal",
+        back_populates="match",
+        cascade="all, delete-orphan",
+        order_by="(Goal.half, Goal.minute)",  # 得点経過順（前半→後半、分順）
+    )
     locked_by_user = relationship("User", foreign_keys=[locked_by])
     entered_by_user = relationship("User", foreign_keys=[entered_by])
     approved_by_user = relationship("User", foreign_keys=[approved_by])
@@ -3,12 +3,27 @@ Reports（報告書）ルーター
 報告書の生成とPDF/Excelエクスポートを提供
 """
 
+import asyncio
+import base64
 import io
+import threading
+import time
+import uuid
+from concurrent.futures import Executor
 from datetime import datetime, date
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session, joinedload
+from operator import attrgetter
+from typing import Dict, List, Optional, Union
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import case, func, insert, lambda_stmt, select
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
 
 from database import get_db
 from models.tournament import Tournament
@@ -16,6 +31,10 @@ from models.match import Match, MatchStage, MatchStatus
 from models.venue import Venue
 from models.goal import Goal
 from models.report_recipient import ReportRecipient
+from models.standing import Standing
+from models.team import Team
+from services.report_service import ReportService
+from services.reports import FinalDayScheduleGenerator, FinalResultReportGenerator
 from schemas.report import (
     ReportRecipientCreate,
     ReportRecipientResponse,
@@ -30,12 +49,23 @@ from schemas.report import (
 router = APIRouter()
 
 
+def get_report_db(db: Session = Depends(get_db)) -> Session:
+    """
+    報告書ルーター用のDBセッション
+
+    commit後も属性を保持し、登録・更新結果のレスポンス生成時に再SELECTしない。
+    他のルーターのセッションには影響しない。
+    """
+    db.expire_on_commit = False
+    return db
+
+
 # ================== 報告書送信先管理 ==================
 
 @router.get("/recipients", response_model=List[ReportRecipientResponse])
 def get_recipients(
     tournament_id: int = Query(..., description="大会ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """報告書送信先一覧を取得"""
     recipients = db.query(ReportRecipient).filter(
@@ -47,11 +77,11 @@ def get_recipients(
 @router.post("/recipients", response_model=ReportRecipientResponse, status_code=status.HTTP_201_CREATED)
 def create_recipient(
     recipient_data: ReportRecipientCreate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """報告書送信先を追加"""
-    tournament = db.query(Tournament).filter(Tournament.id == recipient_data.tournament_id).first()
-    if not tournament:
+    tournament_exists = db.query(Tournament.id).filter(Tournament.id == recipient_data.tournament_id).scalar()
+    if not tournament_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"大会が見つかりません (ID: {recipient_data.tournament_id})"
@@ -60,7 +90,6 @@ def create_recipient(
     recipient = ReportRecipient(**recipient_data.model_dump(by_alias=False))
     db.add(recipient)
     db.commit()
-    db.refresh(recipient)
 
     return recipient
 
@@ -68,10 +97,10 @@ def create_recipient(
 @router.delete("/recipients/{recipient_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_recipient(
     recipient_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """報告書送信先を削除"""
-    recipient = db.query(ReportRecipient).filter(ReportRecipient.id == recipient_id).first()
+    recipient = db.get(ReportRecipient, recipient_id)
     if not recipient:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -87,7 +116,7 @@ def delete_recipient(
 @router.post("/recipients/{tournament_id}/setup-default", response_model=List[ReportRecipientResponse])
 def setup_default_recipients(
     tournament_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     デフォルトの送信先を設定
@@ -97,8 +126,8 @@ def setup_default_recipients(
     - イシクラ
     - 埼玉県サッカー協会
     """
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
+    tournament_exists = db.query(Tournament.id).filter(Tournament.id == tournament_id).scalar()
+    if not tournament_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"大会が見つかりません (ID: {tournament_id})"
@@ -111,20 +140,12 @@ def setup_default_recipients(
         {"name": "埼玉県サッカー協会", "notes": ""},
     ]
 
-    created = []
-    for data in default_recipients:
-        recipient = ReportRecipient(
-            tournament_id=tournament_id,
-            **data,
-        )
-        db.add(recipient)
-        created.append(recipient)
+    # 1回のINSERT ... RETURNINGで登録し、行ごとの再取得（refresh）を省く
+    rows = [{"tournament_id": tournament_id, **data} for data in default_recipients]
+    created = db.scalars(insert(ReportRecipient).returning(ReportRecipient), rows).all()
 
     db.commit()
 
-    for r in created:
-        db.refresh(r)
-
     return created
 
 
@@ -135,14 +156,25 @@ def setup_default_recipients(
 @router.get("/sender-settings/{tournament_id}", response_model=SenderSettingsResponse, include_in_schema=False)
 def get_sender_settings(
     tournament_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     報告書発信元設定を取得
 
     要件準拠パス: GET /tournaments/{id}/report-settings
     """
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    # 発信元設定で読み書きする列のみをロードする
+    tournament = db.get(
+        Tournament,
+        tournament_id,
+        options=[
+            load_only(
+                Tournament.sender_organization,
+                Tournament.sender_name,
+                Tournament.sender_contact,
+            )
+        ],
+    )
     if not tournament:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -161,14 +193,25 @@ def get_sender_settings(
 def update_sender_settings(
     tournament_id: int,
     settings: SenderSettingsUpdate,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     報告書発信元設定を更新
 
     要件準拠パス: PUT /tournaments/{id}/report-settings
     """
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    # 発信元設定で読み書きする列のみをロードする
+    tournament = db.get(
+        Tournament,
+        tournament_id,
+        options=[
+            load_only(
+                Tournament.sender_organization,
+                Tournament.sender_name,
+                Tournament.sender_contact,
+            )
+        ],
+    )
     if not tournament:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -182,7 +225,6 @@ def update_sender_settings(
             setattr(tournament, field, value)
 
     db.commit()
-    db.refresh(tournament)
 
     return SenderSettingsResponse(
         sender_organization=tournament.sender_organization,
@@ -193,15 +235,42 @@ def update_sender_settings(
 
 # ================== 報告書データ取得 ==================
 
+# 得点経過の前後半表記（Goal.half: 前半=1, 後半=2）
+HALF_TEXT = ("", "前半", "後半")
+
+# 前後半スコア（ホーム前半, ホーム後半, アウェイ前半, アウェイ後半）をまとめて取得
+MATCH_HALF_SCORES = attrgetter(
+    "home_score_half1", "home_score_half2", "away_score_half1", "away_score_half2"
+)
+
+
+def _filter_venue_and_order(stmt, venue_id: Optional[int]):
+    """
+    日別試合クエリ（lambda_stmt）に会場条件と並び順を付与する
+
+    lambda_stmtはSQLのコンパイル結果をキャッシュし、会場指定の有無で
+    別のキャッシュエントリとなる。
+    """
+    if venue_id:
+        stmt += lambda s: s.where(Match.venue_id == venue_id)
+    stmt += lambda s: s.order_by(Match.venue_id, Match.match_order)
+    return stmt
+
+
 @router.get("/data", response_model=ReportData)
 def get_report_data(
     tournament_id: int = Query(..., description="大会ID"),
     target_date: date = Query(..., description="対象日"),
     venue_id: Optional[int] = Query(None, description="会場ID（省略時は全会場）"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """報告書用データを取得"""
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    # 送信先も同じクエリで取得する
+    tournament = db.get(
+        Tournament,
+        tournament_id,
+        options=[joinedload(Tournament.report_recipients)],
+    )
     if not tournament:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -209,43 +278,35 @@ def get_report_data(
         )
 
     # 試合データを取得
-    query = (
-        db.query(Match)
+    # 多対一はJOINで、得点（一対多）はIN句の別クエリで取得し、行の重複を避ける
+    stmt = lambda_stmt(
+        lambda: select(Match)
         .options(
             joinedload(Match.home_team),
             joinedload(Match.away_team),
             joinedload(Match.venue),
             joinedload(Match.group),
-            joinedload(Match.goals),
+            selectinload(Match.goals),
         )
-        .filter(
+        .where(
             Match.tournament_id == tournament_id,
             Match.match_date == target_date,
             Match.stage != MatchStage.TRAINING,  # 研修試合は報告書に含めない
         )
     )
-
-    if venue_id:
-        query = query.filter(Match.venue_id == venue_id)
-
-    matches = query.order_by(Match.venue_id, Match.match_order).all()
+    matches = db.scalars(_filter_venue_and_order(stmt, venue_id)).all()
 
     # 会場情報
     venue = None
     if venue_id:
-        venue = db.query(Venue).filter(Venue.id == venue_id).first()
-
-    # 送信先
-    recipients = db.query(ReportRecipient).filter(
-        ReportRecipient.tournament_id == tournament_id
-    ).all()
+        venue = db.get(Venue, venue_id)
 
     return ReportData(
         tournament=tournament,
         date=target_date.isoformat(),
         venue=venue,
         matches=matches,
-        recipients=recipients,
+        recipients=tournament.report_recipients,
         generated_at=datetime.now().isoformat(),
         generated_by="浦和カップ運営事務局",
     )
@@ -256,58 +317,51 @@ def get_match_reports(
     tournament_id: int = Query(..., description="大会ID"),
     target_date: date = Query(..., description="対象日"),
     venue_id: Optional[int] = Query(None, description="会場ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     試合報告書形式でデータを取得
 
     報告書出力用に整形されたデータを返す
     """
-    query = (
-        db.query(Match)
+    stmt = lambda_stmt(
+        lambda: select(Match)
         .options(
             joinedload(Match.home_team),
             joinedload(Match.away_team),
-            joinedload(Match.goals).joinedload(Goal.team),
+            selectinload(Match.goals).joinedload(Goal.team),
         )
-        .filter(
+        .where(
             Match.tournament_id == tournament_id,
             Match.match_date == target_date,
             Match.status == MatchStatus.COMPLETED,
             Match.stage != MatchStage.TRAINING,
         )
     )
-
-    if venue_id:
-        query = query.filter(Match.venue_id == venue_id)
-
-    matches = query.order_by(Match.venue_id, Match.match_order).all()
+    matches = db.scalars(_filter_venue_and_order(stmt, venue_id)).all()
 
     reports = []
     for match in matches:
-        # 得点情報を整形
+        # 得点情報を整形（Match.goalsは前半→後半、分順で取得済み）
         goals = []
-        for goal in sorted(match.goals, key=lambda g: (g.half, g.minute)):
-            half_text = "前半" if goal.half == 1 else "後半"
-            display = f"{half_text}{goal.minute}分 {goal.team.name} {goal.player_name}"
-            if goal.is_own_goal:
-                display += "(OG)"
-            if goal.is_penalty:
-                display += "(PK)"
+        for goal in match.goals:
+            team_name = goal.team.name
+            display = "".join((
+                HALF_TEXT[goal.half], str(goal.minute), "分 ", team_name, " ", goal.player_name,
+                "(OG)" if goal.is_own_goal else "",
+                "(PK)" if goal.is_penalty else "",
+            ))
 
             goals.append(GoalReport(
                 minute=goal.minute,
                 half=goal.half,
-                team_name=goal.team.name,
+                team_name=team_name,
                 player_name=goal.player_name,
                 display_text=display,
             ))
 
         # スコア文字列を生成
-        h1 = match.home_score_half1 or 0
-        h2 = match.home_score_half2 or 0
-        a1 = match.away_score_half1 or 0
-        a2 = match.away_score_half2 or 0
+        h1, h2, a1, a2 = (score or 0 for score in MATCH_HALF_SCORES(match))
 
         score_pk = None
         if match.has_penalty_shootout:
@@ -315,7 +369,7 @@ def get_match_reports(
 
         reports.append(MatchReport(
             match_number=match.match_order,
-            kickoff_time=match.match_time.strftime("%H:%M"),
+            kickoff_time=match.match_time.isoformat(timespec="minutes"),
             home_team_name=match.home_team.short_name or match.home_team.name,
             away_team_name=match.away_team.short_name or match.away_team.name,
             score_half1=f"{h1}-{a1}",
@@ -331,7 +385,58 @@ def get_match_reports(
 # ================== PDF/Excel出力 ==================
 # 要件準拠パス: POST /tournaments/{id}/reports/daily, POST /tournaments/{id}/reports/final
 
-from pydantic import BaseModel
+# ストリーミング出力時の1チャンクあたりのバイト数
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _BytesSink:
+    """書き込まれたバイト列をコピーせずに保持する書き込み先"""
+
+    def __init__(self):
+        self.parts: List[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self.parts.append(data)
+        return len(data)
+
+
+def _render_to_bytes(render, *args) -> bytes:
+    """
+    render(out, *args) の出力をバイト列で返す（描画プロセス上で実行）
+
+    ReportLabはsave()時にPDF全体を1回で書き込むため、BytesIOに複製せずそのまま返す。
+    """
+    sink = _BytesSink()
+    render(sink, *args)
+    return b"".join(sink.parts)
+
+
+async def _render_in_process(executor: Executor, render, *args) -> bytes:
+    """
+    render(out, *args) をプロセスプールで実行し、出力をバイト列で返す
+
+    ReportLabの描画はCPUを占有するため、GILを共有しない別プロセスで行い複数の出力を並列に処理する。
+    プールは main.py の lifespan で生成・終了する（app.state.render_executor）。
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, _render_to_bytes, render, *args)
+
+
+async def _iter_chunks(data: Union[io.BytesIO, bytes], size: int = STREAM_CHUNK_SIZE):
+    """
+    生成済みの出力を固定サイズのチャンクで返す
+
+    同期イテレータを渡すとStreamingResponseが1行ごとにスレッドプールへ
+    ディスパッチするため、非同期ジェネレータでまとめて返す。
+    BytesIOは内部バッファを直接参照し、全体を読み直す複製を作らない。
+    """
+    view = data.getbuffer() if isinstance(data, io.BytesIO) else memoryview(data)
+    try:
+        for offset in range(0, len(view), size):
+            yield bytes(view[offset:offset + size])
+    finally:
+        view.release()
+
 
 class DailyReportRequest(BaseModel):
     """日別報告書リクエスト"""
@@ -343,7 +448,7 @@ class DailyReportRequest(BaseModel):
 def generate_daily_report_pdf(
     tournament_id: int,
     request: DailyReportRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     日別試合結果報告書をPDFで出力
@@ -354,8 +459,6 @@ def generate_daily_report_pdf(
         date: 対象日
         venue_ids: 会場IDリスト（省略時は全会場）
     """
-    from services.report_service import ReportService
-
     report_service = ReportService(db)
     venue_id = request.venue_ids[0] if request.venue_ids and len(request.venue_ids) == 1 else None
 
@@ -370,7 +473,7 @@ def generate_daily_report_pdf(
     filename = f"浦和カップ_試合結果_{request.date.isoformat()}.pdf"
 
     return StreamingResponse(
-        pdf_buffer,
+        _iter_chunks(pdf_buffer),
         media_type="application/pdf",
         headers={
             "Content-Disposition": f"attachment; filename*=UTF-8''{filename}"
@@ -381,15 +484,13 @@ def generate_daily_report_pdf(
 @router.post("/tournaments/{tournament_id}/final")
 def generate_final_report_pdf(
     tournament_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     最終結果報告書をPDFで出力
 
     要件準拠パス: POST /tournaments/{id}/reports/final
     """
-    from services.reports import FinalResultReportGenerator
-
     try:
         generator = FinalResultReportGenerator(
             db=db,
@@ -410,7 +511,7 @@ def generate_final_report_pdf(
     filename = f"浦和カップ_最終結果.pdf"
 
     return StreamingResponse(
-        pdf_buffer,
+        _iter_chunks(pdf_buffer),
         media_type="application/pdf",
         headers={
             "Content-Disposition": f"attachment; filename*=UTF-8''{filename}"
@@ -424,15 +525,13 @@ def export_report_pdf(
     tournament_id: int = Query(..., description="大会ID"),
     target_date: date = Query(..., description="対象日"),
     venue_id: Optional[int] = Query(None, description="会場ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     報告書をPDFで出力（レガシー）
 
     指定日・指定会場の試合結果をPDF形式で出力
     """
-    from services.report_service import ReportService
-
     report_service = ReportService(db)
 
     try:
@@ -449,7 +548,7 @@ def export_report_pdf(
     filename += ".pdf"
 
     return StreamingResponse(
-        pdf_buffer,
+        _iter_chunks(pdf_buffer),
         media_type="application/pdf",
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
@@ -462,15 +561,13 @@ def export_report_excel(
     tournament_id: int = Query(..., description="大会ID"),
     target_date: date = Query(..., description="対象日"),
     venue_id: Optional[int] = Query(None, description="会場ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     報告書をExcelで出力
 
     指定日・指定会場の試合結果をExcel形式で出力
     """
-    from services.report_service import ReportService
-
     report_service = ReportService(db)
 
     try:
@@ -487,7 +584,7 @@ def export_report_excel(
     filename += ".xlsx"
 
     return StreamingResponse(
-        excel_buffer,
+        _iter_chunks(excel_buffer),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
@@ -499,15 +596,13 @@ def export_report_excel(
 def export_final_day_schedule_pdf(
     tournament_id: int = Query(..., description="大会ID"),
     target_date: date = Query(..., description="対象日"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     最終日組み合わせ表をPDFで出力
 
     予選終了後に生成される最終日の組み合わせ表
     """
-    from services.reports import FinalDayScheduleGenerator
-
     try:
         generator = FinalDayScheduleGenerator(
             db=db,
@@ -529,7 +624,7 @@ def export_final_day_schedule_pdf(
     filename = f"final_day_schedule_{target_date.isoformat()}.pdf"
 
     return StreamingResponse(
-        pdf_buffer,
+        _iter_chunks(pdf_buffer),
         media_type="application/pdf",
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
@@ -540,7 +635,7 @@ def export_final_day_schedule_pdf(
 @router.get("/export/final-result", include_in_schema=False)
 def export_final_result_pdf(
     tournament_id: int = Query(..., description="大会ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     最終結果報告書をPDFで出力（レガシー）
@@ -548,8 +643,6 @@ def export_final_result_pdf(
     決勝トーナメントの結果、最終順位、優秀選手を含む
     新しいAPI: POST /tournaments/{id}/final
     """
-    from services.reports import FinalResultReportGenerator
-
     try:
         generator = FinalResultReportGenerator(
             db=db,
@@ -570,7 +663,7 @@ def export_final_result_pdf(
     filename = f"final_result_tournament_{tournament_id}.pdf"
 
     return StreamingResponse(
-        pdf_buffer,
+        _iter_chunks(pdf_buffer),
         media_type="application/pdf",
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
@@ -579,21 +672,112 @@ def export_final_result_pdf(
 
 
 @router.get("/export/group-standings")
-def export_group_standings_pdf(
+async def export_group_standings_pdf(
+    request: Request,
     tournament_id: int = Query(..., description="大会ID"),
     group_id: Optional[str] = Query(None, description="グループID（省略時は全グループ）"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     グループ順位表をPDFで出力
 
     予選リーグ終了後のグループ別順位表
     """
-    from models.group import Group
-    from models.standing import Standing
-    from models.team import Team
+    # DBアクセスは同期処理のため、イベントループを塞がないようスレッドプールで行う
+    title, rows = await run_in_threadpool(_load_group_standings, db, tournament_id, group_id)
+
+    try:
+        pdf_bytes = await _render_in_process(
+            request.app.state.render_executor, _render_group_standings, title, rows
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"グループ順位表の生成に失敗しました: {str(e)}"
+        )
+
+    return StreamingResponse(
+        _iter_chunks(pdf_bytes),
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename={_group_standings_filename(tournament_id, group_id)}"
+        }
+    )
+
+
+@router.post("/export/group-standings/jobs", status_code=status.HTTP_202_ACCEPTED)
+def create_group_standings_job(
+    request: Request,
+    background_tasks: BackgroundTasks,
+    tournament_id: int = Query(..., description="大会ID"),
+    group_id: Optional[str] = Query(None, description="グループID（省略時は全グループ）"),
+    db: Session = Depends(get_report_db),
+):
+    """
+    グループ順位表PDFの生成ジョブを登録
+
+    PDFの描画はレスポンス返却後にバックグラウンドでプロセスプールに投入する。
+    返却された status_url をポーリングし、完了後に同じURLからダウンロードする。
+    """
+    title, rows = _load_group_standings(db, tournament_id, group_id)
+
+    job = _create_export_job(_group_standings_filename(tournament_id, group_id))
+    background_tasks.add_task(
+        _run_export_job, job, request.app.state.render_executor, _render_group_standings, title, rows
+    )
+
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "status_url": str(request.url_for("get_export_job", job_id=job.id)),
+    }
+
+
+@router.get("/export/jobs/{job_id}")
+def get_export_job(job_id: str):
+    """
+    出力ジョブの状態取得・ダウンロード
 
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    - 生成中: 202 と状態を返す
+    - 完了: PDFを返す（返却後はジョブを破棄する）
+    - 失敗: 500 を返す
+    """
+    job = _get_export_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"出力ジョブが見つかりません (ID: {job_id})"
+        )
+
+    if job.status == ExportJob.FAILED:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"出力に失敗しました: {job.error}"
+        )
+
+    if job.status != ExportJob.COMPLETED:
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"job_id": job.id, "status": job.status},
+        )
+
+    return StreamingResponse(
+        _iter_chunks(job.content),
+        media_type=job.media_type,
+        headers={
+            "Content-Disposition": f"attachment; filename={job.filename}"
+        }
+    )
+
+
+def _load_group_standings(db: Session, tournament_id: int, group_id: Optional[str]):
+    """
+    グループ順位表の描画データを取得
+
+    Returns:
+        (タイトル, 描画用の行タプルのリスト)
+    """
+    tournament = db.get(Tournament, tournament_id, options=[load_only(Tournament.name)])
     if not tournament:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -604,112 +788,208 @@ def export_group_standings_pdf(
     if group_id:
         query = query.filter(Standing.group_id == group_id)
 
-    standings = query.order_by(Standing.group_id, Standing.rank).all()
-
-    if not standings:
+    # 順位データの有無を1行だけ確認し、空の場合はJOIN・ソート付きの取得を行わない
+    if query.with_entities(Standing.id).limit(1).scalar() is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="順位データが見つかりません"
         )
 
-    try:
-        from reportlab.lib.pagesizes import A4
-        from reportlab.lib.units import mm
-        from reportlab.pdfgen import canvas
-        from reportlab.pdfbase import pdfmetrics
-        from reportlab.pdfbase.ttfonts import TTFont
-    except ImportError:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="ReportLabがインストールされていません"
+    # グループ・チームは描画ループ内で参照するため一括ロード（N+1回避）
+    standings = (
+        query.options(
+            joinedload(Standing.group),
+            joinedload(Standing.team),
         )
+        .order_by(Standing.group_id, Standing.rank)
+        .all()
+    )
 
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
-    width, height = A4
+    # 描画時にORMの遅延ロードが発生しないよう、必要な値を先に取り出す
+    rows = [
+        (
+            standing.group_id,
+            standing.group.name if standing.group else standing.group_id,
+            standing.rank,
+            (standing.team.short_name or standing.team.name) if standing.team else "Unknown",
+            standing.played,
+            standing.won,
+            standing.drawn,
+            standing.lost,
+            standing.goals_for,
+            standing.goals_against,
+            standing.goal_difference,
+        )
+        for standing in standings
+    ]
+
+    return f"{tournament.name} グループ順位表", rows
+
+
+def _group_standings_filename(tournament_id: int, group_id: Optional[str]) -> str:
+    """グループ順位表PDFのファイル名"""
+    filename = f"group_standings_tournament_{tournament_id}"
+    if group_id:
+        filename += f"_group_{group_id}"
+    return filename + ".pdf"
+
+
+# ================== 出力ジョブ管理 ==================
+# ジョブはプロセス内のメモリで管理する（複数ワーカー構成では同一ワーカーへのポーリングが前提）
+
+# 出力ジョブの保持時間（秒）。経過したジョブは次回のジョブ登録時に破棄する
+EXPORT_JOB_TTL_SECONDS = 10 * 60
+
+
+class ExportJob:
+    """PDF出力ジョブ"""
+
+    PENDING = "pending"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+    def __init__(self, filename: str, media_type: str = "application/pdf"):
+        self.id = uuid.uuid4().hex
+        self.filename = filename
+        self.media_type = media_type
+        self.status = self.PENDING
+        self.content: Optional[bytes] = None
+        self.error: Optional[str] = None
+        self.created_at = time.monotonic()
+
+
+_export_jobs: Dict[str, ExportJob] = {}
+_export_jobs_lock = threading.Lock()
+
+
+def _purge_expired_export_jobs() -> None:
+    """保持期限切れのジョブを破棄する（呼び出し側でロックを保持すること）"""
+    expires_before = time.monotonic() - EXPORT_JOB_TTL_SECONDS
+    for expired_id in [k for k, v in _export_jobs.items() if v.created_at < expires_before]:
+        del _export_jobs[expired_id]
 
+
+def _create_export_job(filename: str) -> ExportJob:
+    """出力ジョブを登録し、保持期限切れのジョブを破棄する"""
+    job = ExportJob(filename)
+    with _export_jobs_lock:
+        _purge_expired_export_jobs()
+        _export_jobs[job.id] = job
+    return job
+
+
+def _get_export_job(job_id: str) -> Optional[ExportJob]:
+    """
+    出力ジョブを取得する
+
+    保持期限切れのジョブを破棄したうえで取得し、
+    完了済みのジョブは結果を返した後に保持しないよう一覧から取り除く。
+    """
+    with _export_jobs_lock:
+        _purge_expired_export_jobs()
+        job = _export_jobs.get(job_id)
+        if job and job.status == ExportJob.COMPLETED:
+            del _export_jobs[job_id]
+    return job
+
+
+async def _run_export_job(job: ExportJob, executor: Executor, render, *args) -> None:
+    """バックグラウンドでPDFをプロセスプールで描画し、結果をジョブに格納する"""
     try:
-        pdfmetrics.registerFont(TTFont('Gothic', 'C:/Windows/Fonts/msgothic.ttc'))
-        font_name = 'Gothic'
-    except Exception:
+        job.content = await _render_in_process(executor, render, *args)
+        job.status = ExportJob.COMPLETED
+    except Exception as e:
+        job.error = str(e)
+        job.status = ExportJob.FAILED
+
+
+def _register_font() -> str:
+    """
+    日本語フォントを登録し、使用するフォント名を返す
+
+    TTCの読み込みは重いため、モジュール読み込み時に1回だけ実行する
+    """
+    for font_path in (
+        'C:/Windows/Fonts/msgothic.ttc',
+        '/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc',
+    ):
         try:
-            pdfmetrics.registerFont(TTFont('Gothic', '/System/Library/Fonts/ヒラギノ角ゴシック W3.ttc'))
-            font_name = 'Gothic'
+            pdfmetrics.registerFont(TTFont('Gothic', font_path))
+            return 'Gothic'
         except Exception:
-            font_name = 'Helvetica'
+            continue
+
+    return 'Helvetica'
+
+
+FONT_NAME = _register_font()
+
+# 順位表ヘッダー（x座標[mm], 見出し）
+STANDINGS_HEADER_COLUMNS = (
+    (30, "順位"),
+    (45, "チーム名"),
+    (100, "試合"),
+    (115, "勝"),
+    (125, "分"),
+    (135, "負"),
+    (145, "得点"),
+    (160, "失点"),
+    (175, "得失点差"),
+)
+
+
+def _render_group_standings(out, title: str, rows: list) -> None:
+    """グループ順位表PDFを描画し、書き込み先 out に出力する"""
+    c = canvas.Canvas(out, pagesize=A4)
+    width, height = A4
 
     y = height - 20 * mm
 
-    c.setFont(font_name, 16)
-    c.drawString(30 * mm, y, f"{tournament.name} グループ順位表")
+    c.setFont(FONT_NAME, 16)
+    c.drawString(30 * mm, y, title)
     y -= 15 * mm
 
     current_group = None
-    for standing in standings:
-        if standing.group_id != current_group:
+    for (group_id, group_name, rank, team_name, played, won, drawn, lost,
+         goals_for, goals_against, goal_difference) in rows:
+        if group_id != current_group:
             if current_group is not None:
                 y -= 10 * mm
 
             if y < 80 * mm:
                 c.showPage()
                 y = height - 20 * mm
-                c.setFont(font_name, 12)
+                c.setFont(FONT_NAME, 12)
 
-            current_group = standing.group_id
-            group = db.query(Group).filter(Group.id == standing.group_id).first()
-            group_name = group.name if group else standing.group_id
+            current_group = group_id
 
-            c.setFont(font_name, 12)
+            c.setFont(FONT_NAME, 12)
             c.drawString(30 * mm, y, f"【{group_name}】")
             y -= 8 * mm
 
-            c.setFont(font_name, 9)
-            c.drawString(30 * mm, y, "順位")
-            c.drawString(45 * mm, y, "チーム名")
-            c.drawString(100 * mm, y, "試合")
-            c.drawString(115 * mm, y, "勝")
-            c.drawString(125 * mm, y, "分")
-            c.drawString(135 * mm, y, "負")
-            c.drawString(145 * mm, y, "得点")
-            c.drawString(160 * mm, y, "失点")
-            c.drawString(175 * mm, y, "得失点差")
+            c.setFont(FONT_NAME, 9)
+            for x, label in STANDINGS_HEADER_COLUMNS:
+                c.drawString(x * mm, y, label)
             y -= 5 * mm
 
             c.line(30 * mm, y + 2 * mm, 190 * mm, y + 2 * mm)
 
-        team = db.query(Team).filter(Team.id == standing.team_id).first()
-        team_name = team.short_name or team.name if team else "Unknown"
-
-        c.setFont(font_name, 9)
-        c.drawString(32 * mm, y, str(standing.rank))
+        c.setFont(FONT_NAME, 9)
+        c.drawString(32 * mm, y, str(rank))
         c.drawString(45 * mm, y, team_name[:15])
-        c.drawString(102 * mm, y, str(standing.played))
-        c.drawString(117 * mm, y, str(standing.won))
-        c.drawString(127 * mm, y, str(standing.drawn))
-        c.drawString(137 * mm, y, str(standing.lost))
-        c.drawString(147 * mm, y, str(standing.goals_for))
-        c.drawString(162 * mm, y, str(standing.goals_against))
-        c.drawString(177 * mm, y, str(standing.goal_difference))
+        c.drawString(102 * mm, y, str(played))
+        c.drawString(117 * mm, y, str(won))
+        c.drawString(127 * mm, y, str(drawn))
+        c.drawString(137 * mm, y, str(lost))
+        c.drawString(147 * mm, y, str(goals_for))
+        c.drawString(162 * mm, y, str(goals_against))
+        c.drawString(177 * mm, y, str(goal_difference))
         y -= 5 * mm
 
-    c.setFont(font_name, 8)
+    c.setFont(FONT_NAME, 8)
     c.drawString(30 * mm, 15 * mm, "浦和カップ運営事務局")
 
     c.save()
-    buffer.seek(0)
-
-    filename = f"group_standings_tournament_{tournament_id}"
-    if group_id:
-        filename += f"_group_{group_id}"
-    filename += ".pdf"
-
-    return StreamingResponse(
-        buffer,
-        media_type="application/pdf",
-        headers={
-            "Content-Disposition": f"attachment; filename={filename}"
-        }
-    )
 
 
 # ================== プレビュー機能 ==================
@@ -719,16 +999,13 @@ def preview_report_pdf(
     tournament_id: int = Query(..., description="大会ID"),
     target_date: date = Query(..., description="対象日"),
     venue_id: Optional[int] = Query(None, description="会場ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     報告書PDFのプレビュー（Base64）
 
     PDFをBase64エンコードして返す。フロントエンドでiframeに表示可能。
     """
-    import base64
-    from services.report_service import ReportService
-
     report_service = ReportService(db)
 
     try:
@@ -751,14 +1028,11 @@ def preview_report_pdf(
 @router.get("/preview/final-result")
 def preview_final_result_pdf(
     tournament_id: int = Query(..., description="大会ID"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     最終結果報告書PDFのプレビュー（Base64）
     """
-    import base64
-    from services.reports import FinalResultReportGenerator
-
     try:
         generator = FinalResultReportGenerator(
             db=db,
@@ -791,7 +1065,7 @@ def preview_final_result_pdf(
 def check_incomplete_data(
     tournament_id: int = Query(..., description="大会ID"),
     target_date: Optional[date] = Query(None, description="対象日（省略時は最終結果チェック）"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     未入力データをチェック
@@ -802,8 +1076,8 @@ def check_incomplete_data(
         warnings: 未入力項目のリスト
         can_export: 出力可能かどうか（致命的な未入力がなければTrue）
     """
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
+    tournament_exists = db.query(Tournament.id).filter(Tournament.id == tournament_id).scalar()
+    if not tournament_exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"大会が見つかりません (ID: {tournament_id})"
@@ -904,7 +1178,6 @@ def _check_daily_report_data(db: Session, tournament_id: int, target_date: date)
 def _check_final_result_data(db: Session, tournament_id: int):
     """最終結果報告書の未入力チェック"""
     from models.award import Award
-    from models.standing import Standing
 
     warnings = []
     critical_warnings = []
@@ -967,42 +1240,56 @@ def _check_final_result_data(db: Session, tournament_id: int):
 @router.get("/summary/{tournament_id}")
 def get_tournament_summary(
     tournament_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_report_db),
 ):
     """
     大会サマリーを取得
 
     ダッシュボード用の統計情報
     """
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    tournament = db.get(Tournament, tournament_id, options=[load_only(Tournament.name)])
     if not tournament:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"大会が見つかりません (ID: {tournament_id})"
         )
 
-    from models.team import Team
-    from models.match import Match
-
-    # チーム数
-    team_count = db.query(Team).filter(Team.tournament_id == tournament_id).count()
-
-    # 試合数
-    match_stats = db.query(Match).filter(Match.tournament_id == tournament_id)
-    total_matches = match_stats.count()
-    completed_matches = match_stats.filter(Match.status == MatchStatus.COMPLETED).count()
+    # チーム数・総得点（スカラーサブクエリで1クエリにまとめる）
+    # 総得点は試合とJOINせず、大会の試合IDのIN句で数える
+    team_count, total_goals = db.execute(
+        select(
+            select(func.count())
+            .select_from(Team)
+            .where(Team.tournament_id == tournament_id)
+            .scalar_subquery(),
+            select(func.count())
+            .select_from(Goal)
+            .where(Goal.match_id.in_(select(Match.id).where(Match.tournament_id == tournament_id)))
+            .scalar_subquery(),
+        )
+    ).one()
+
+    # ステージ別の試合数・完了数をGROUP BYの1クエリで集計し、全体の件数もここから求める
+    stage_rows = db.execute(
+        select(
+            Match.stage,
+            func.count(),
+            func.sum(case((Match.status == MatchStatus.COMPLETED, 1), else_=0)),
+        )
+        .where(Match.tournament_id == tournament_id)
+        .group_by(Match.stage)
+    ).all()
+    stage_stats = {stage: (count, completed) for stage, count, completed in stage_rows}
 
-    # ステージ別試合数
-    stage_counts = {}
-    for stage in MatchStage:
-        count = match_stats.filter(Match.stage == stage).count()
-        if count > 0:
-            stage_counts[stage.value] = count
+    total_matches = sum(count for count, _ in stage_stats.values())
+    completed_matches = sum(completed for _, completed in stage_stats.values())
 
-    # 総得点
-    total_goals = db.query(Goal).join(Match).filter(
-        Match.tournament_id == tournament_id
-    ).count()
+    # ステージ別試合数（MatchStageの定義順）
+    stage_counts = {
+        stage.value: stage_stats[stage][0]
+        for stage in MatchStage
+        if stage in stage_stats
+    }
 
     return {
         "tournament_id": tournament_id,
@@ -12,6 +12,7 @@ from sqlalchemy.pool import StaticPool
 
 from backend.main import app
 from backend.database import get_db
+from database import get_db as app_get_db
 from backend.models.base import Base
 
 
@@ -82,6 +83,8 @@ def client(test_session):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
+    # ルーターは `database` モジュールとして読み込まれるため、そちらも差し替える
+    app.dependency_overrides[app_get_db] = override_get_db
 
     with TestClient(app) as test_client:
         yield test_client
@@ -0,0 +1,497 @@
+"""
+報告書APIのテスト
+
+送信先・発信元設定、試合報告書データ、グループ順位表PDFの出力・出力ジョブ、大会サマリーのテスト
+"""
+
+from datetime import date, time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+import routes.reports as reports
+from models.tournament import Tournament
+from models.team import Team, TeamType
+from models.venue import Venue
+from models.match import Match, MatchStage, MatchStatus
+from models.goal import Goal
+from models.group import Group
+from models.standing import Standing
+from models.report_recipient import ReportRecipient
+
+
+def create_test_tournament(session: Session, name: str = "テスト大会") -> Tournament:
+    """テスト用大会を作成"""
+    tournament = Tournament(
+        name=name,
+        edition=1,
+        year=2024,
+        start_date=date(2024, 3, 25),
+        end_date=date(2024, 3, 27),
+        match_duration=50,
+        half_duration=25,
+        interval_minutes=15,
+    )
+    session.add(tournament)
+    session.commit()
+    session.refresh(tournament)
+    return tournament
+
+
+def create_test_group(session: Session, tournament_id: int, group_id: str = "A") -> Group:
+    """テスト用グループを作成"""
+    group = Group(tournament_id=tournament_id, id=group_id, name=f"{group_id}グループ")
+    session.add(group)
+    session.commit()
+    return group
+
+
+def create_test_teams(
+    session: Session, tournament_id: int, group_id: str = "A", count: int = 2
+) -> list[Team]:
+    """テスト用チームを作成"""
+    teams = []
+    for i in range(count):
+        team = Team(
+            tournament_id=tournament_id,
+            name=f"テストチーム{group_id}{i+1}",
+            short_name=f"{group_id}{i+1}",
+            team_type=TeamType.LOCAL,
+            group_id=group_id,
+            group_order=i + 1,
+        )
+        session.add(team)
+        teams.append(team)
+    session.commit()
+    for team in teams:
+        session.refresh(team)
+    return teams
+
+
+def create_test_standings(session: Session, tournament_id: int, teams: list[Team]) -> None:
+    """テスト用順位データを作成"""
+    for rank, team in enumerate(teams, start=1):
+        session.add(Standing(
+            tournament_id=tournament_id,
+            group_id=team.group_id,
+            team_id=team.id,
+            rank=rank,
+        ))
+    session.commit()
+
+
+def create_test_venue(session: Session, tournament_id: int, name: str = "テスト会場") -> Venue:
+    """テスト用会場を作成"""
+    venue = Venue(tournament_id=tournament_id, name=name, max_matches_per_day=6)
+    session.add(venue)
+    session.commit()
+    session.refresh(venue)
+    return venue
+
+
+def create_test_match(
+    session: Session,
+    tournament_id: int,
+    venue_id: int,
+    teams: list[Team],
+    stage: MatchStage,
+    status: MatchStatus = MatchStatus.SCHEDULED,
+    match_order: int = 1,
+    match_time: time = time(9, 0),
+) -> Match:
+    """テスト用試合を作成"""
+    match = Match(
+        tournament_id=tournament_id,
+        venue_id=venue_id,
+        home_team_id=teams[0].id,
+        away_team_id=teams[1].id,
+        match_date=date(2024, 3, 25),
+        match_time=match_time,
+        match_order=match_order,
+        stage=stage,
+        status=status,
+    )
+    session.add(match)
+    session.commit()
+    session.refresh(match)
+    return match
+
+
+def create_test_goals(session: Session, match: Match, count: int) -> None:
+    """テスト用得点を作成（ホームチームの得点）"""
+    for i in range(count):
+        session.add(Goal(
+            match_id=match.id,
+            team_id=match.home_team_id,
+            player_name=f"選手{i+1}",
+            minute=10 + i,
+            half=1,
+        ))
+    session.commit()
+
+
+@pytest.fixture
+def standings_tournament(test_session: Session) -> Tournament:
+    """順位データ登録済みの大会"""
+    tournament = create_test_tournament(test_session)
+    create_test_group(test_session, tournament.id)
+    teams = create_test_teams(test_session, tournament.id)
+    create_test_standings(test_session, tournament.id, teams)
+    return tournament
+
+
+class TestReportRecipientsAPI:
+    """送信先・発信元設定APIのテスト"""
+
+    def test_setup_default_recipients(self, client: TestClient, test_session: Session):
+        """正常系: デフォルト送信先4件を登録し、IDを含めて返す"""
+        tournament = create_test_tournament(test_session)
+
+        response = client.post(f"/api/reports/recipients/{tournament.id}/setup-default")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert [r["name"] for r in data] == ["埼玉新聞", "テレビ埼玉", "イシクラ", "埼玉県サッカー協会"]
+        assert all(isinstance(r["id"], int) for r in data)
+        assert len({r["id"] for r in data}) == 4
+        assert all(r["tournamentId"] == tournament.id for r in data)
+        assert all(r["createdAt"] for r in data)
+
+        ids = test_session.query(ReportRecipient.id).filter(
+            ReportRecipient.tournament_id == tournament.id
+        ).all()
+        assert sorted(r["id"] for r in data) == sorted(row.id for row in ids)
+
+    def test_setup_default_tournament_not_found(self, client: TestClient):
+        """異常系: 存在しない大会は404"""
+        response = client.post("/api/reports/recipients/9999/setup-default")
+
+        assert response.status_code == 404
+
+    def test_update_sender_settings(self, client: TestClient, test_session: Session):
+        """正常系: commit後の値をそのまま返し、指定した項目のみ更新する"""
+        tournament = create_test_tournament(test_session)
+
+        response = client.put(
+            f"/api/reports/tournaments/{tournament.id}/report-settings",
+            json={"senderOrganization": "県立浦和高校サッカー部", "senderName": "浦和太郎"},
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "senderOrganization": "県立浦和高校サッカー部",
+            "senderName": "浦和太郎",
+            "senderContact": None,
+        }
+
+        response = client.get(f"/api/reports/tournaments/{tournament.id}/report-settings")
+        assert response.json()["senderName"] == "浦和太郎"
+
+
+class TestMatchReportsAPI:
+    """試合報告書データAPIのテスト"""
+
+    def test_goals_ordered_with_display_text(self, client: TestClient, test_session: Session):
+        """正常系: 得点は登録順によらず前半→後半、分順で並び、表示文字列を付与する"""
+        tournament = create_test_tournament(test_session)
+        create_test_group(test_session, tournament.id)
+        teams = create_test_teams(test_session, tournament.id)
+        venue = create_test_venue(test_session, tournament.id)
+        match = create_test_match(
+            test_session, tournament.id, venue.id, teams,
+            MatchStage.PRELIMINARY, MatchStatus.COMPLETED, match_time=time(10, 30),
+        )
+        match.home_score_half1, match.home_score_half2 = 2, 0
+        match.away_score_half1, match.away_score_half2 = 0, 1
+
+        # 得点経過とは逆順に登録する
+        test_session.add_all([
+            Goal(match_id=match.id, team_id=teams[1].id, player_name="選手C",
+                 minute=40, half=2, is_own_goal=True),
+            Goal(match_id=match.id, team_id=teams[0].id, player_name="選手B",
+                 minute=20, half=1, is_penalty=True),
+            Goal(match_id=match.id, team_id=teams[0].id, player_name="選手A",
+                 minute=5, half=1),
+        ])
+        test_session.commit()
+
+        response = client.get(
+            "/api/reports/match-reports",
+            params={"tournament_id": tournament.id, "target_date": "2024-03-25"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert len(data) == 1
+        report = data[0]
+        assert report["kickoffTime"] == "10:30"
+        assert report["homeTeamName"] == "A1"
+        assert report["scoreHalf1"] == "2-0"
+        assert report["scoreHalf2"] == "0-1"
+        assert report["scoreTotal"] == "2-1"
+        assert report["scorePk"] is None
+        assert [(g["half"], g["minute"]) for g in report["goals"]] == [(1, 5), (1, 20), (2, 40)]
+        assert [g["displayText"] for g in report["goals"]] == [
+            "前半5分 テストチームA1 選手A",
+            "前半20分 テストチームA1 選手B(PK)",
+            "後半40分 テストチームA2 選手C(OG)",
+        ]
+
+    def test_filters_by_tournament_and_venue(self, client: TestClient, test_session: Session):
+        """会場指定時はその会場の試合のみ、未指定時は大会の全会場の試合を会場・試合順で返す"""
+        tournament = create_test_tournament(test_session)
+        create_test_group(test_session, tournament.id)
+        teams = create_test_teams(test_session, tournament.id)
+        venue1 = create_test_venue(test_session, tournament.id, name="会場1")
+        venue2 = create_test_venue(test_session, tournament.id, name="会場2")
+
+        seeds = [
+            (venue2, 1, time(9, 0), MatchStatus.COMPLETED),
+            (venue1, 2, time(11, 0), MatchStatus.COMPLETED),
+            (venue1, 1, time(10, 0), MatchStatus.COMPLETED),
+            (venue1, 3, time(12, 0), MatchStatus.SCHEDULED),  # 未完了は含めない
+        ]
+        for venue, order, kickoff, match_status in seeds:
+            create_test_match(
+                test_session, tournament.id, venue.id, teams,
+                MatchStage.PRELIMINARY, match_status, match_order=order, match_time=kickoff,
+            )
+
+        # 同日の別大会の試合
+        other = create_test_tournament(test_session, name="別大会")
+        create_test_group(test_session, other.id)
+        other_teams = create_test_teams(test_session, other.id)
+        other_venue = create_test_venue(test_session, other.id)
+        create_test_match(
+            test_session, other.id, other_venue.id, other_teams,
+            MatchStage.PRELIMINARY, MatchStatus.COMPLETED, match_time=time(15, 0),
+        )
+
+        response = client.get(
+            "/api/reports/match-reports",
+            params={"tournament_id": tournament.id, "target_date": "2024-03-25"},
+        )
+        assert response.status_code == 200
+        assert [r["kickoffTime"] for r in response.json()] == ["10:00", "11:00", "09:00"]
+
+        response = client.get(
+            "/api/reports/match-reports",
+            params={
+                "tournament_id": tournament.id,
+                "target_date": "2024-03-25",
+                "venue_id": venue1.id,
+            },
+        )
+        assert response.status_code == 200
+        assert [(r["matchNumber"], r["kickoffTime"]) for r in response.json()] == [
+            (1, "10:00"),
+            (2, "11:00"),
+        ]
+
+        # 別大会の会場を指定しても対象大会の試合しか返さない
+        response = client.get(
+            "/api/reports/match-reports",
+            params={
+                "tournament_id": tournament.id,
+                "target_date": "2024-03-25",
+                "venue_id": other_venue.id,
+            },
+        )
+        assert response.status_code == 200
+        assert response.json() == []
+
+
+class TestGroupStandingsExportAPI:
+    """グループ順位表PDF出力APIのテスト"""
+
+    def test_export_returns_pdf(self, client: TestClient, standings_tournament: Tournament):
+        """正常系: プロセスプールで描画したPDFを返す"""
+        response = client.get(
+            "/api/reports/export/group-standings",
+            params={"tournament_id": standings_tournament.id},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.content.startswith(b"%PDF")
+
+    def test_export_without_standings_not_found(self, client: TestClient, test_session: Session):
+        """異常系: 順位データがない大会は404"""
+        tournament = create_test_tournament(test_session)
+
+        response = client.get(
+            "/api/reports/export/group-standings",
+            params={"tournament_id": tournament.id},
+        )
+
+        assert response.status_code == 404
+
+
+class TestGroupStandingsJobAPI:
+    """グループ順位表PDF出力ジョブAPIのテスト"""
+
+    def test_job_completes_and_returns_pdf(
+        self, client: TestClient, standings_tournament: Tournament
+    ):
+        """正常系: ジョブ登録後、ポーリングでPDFを取得できる"""
+        response = client.post(
+            "/api/reports/export/group-standings/jobs",
+            params={"tournament_id": standings_tournament.id},
+        )
+
+        assert response.status_code == 202
+        data = response.json()
+        assert data["job_id"]
+        assert data["status_url"].endswith(f"/api/reports/export/jobs/{data['job_id']}")
+
+        # バックグラウンドタスクはレスポンス返却後に実行済み
+        response = client.get(data["status_url"])
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/pdf"
+        assert response.content.startswith(b"%PDF")
+
+        # 返却済みのジョブは破棄される
+        response = client.get(data["status_url"])
+        assert response.status_code == 404
+
+    def test_unknown_job_not_found(self, client: TestClient):
+        """異常系: 存在しないジョブIDは404"""
+        response = client.get("/api/reports/export/jobs/unknown")
+
+        assert response.status_code == 404
+        assert "出力ジョブが見つかりません" in response.json()["detail"]
+
+    def test_failed_render_returns_error(
+        self,
+        client: TestClient,
+        standings_tournament: Tournament,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """異常系: PDF描画に失敗したジョブは500"""
+        # 描画プロセスで展開できない行を渡し、描画を失敗させる
+        monkeypatch.setattr(
+            reports, "_load_group_standings", lambda db, tournament_id, group_id: ("タイトル", [("A",)])
+        )
+
+        response = client.post(
+            "/api/reports/export/group-standings/jobs",
+            params={"tournament_id": standings_tournament.id},
+        )
+        assert response.status_code == 202
+
+        response = client.get(response.json()["status_url"])
+
+        assert response.status_code == 500
+        assert response.json()["detail"].startswith("出力に失敗しました")
+
+    def test_expired_job_purged_on_poll(
+        self,
+        client: TestClient,
+        standings_tournament: Tournament,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """保持期限切れのジョブはポーリング時に破棄される"""
+        response = client.post(
+            "/api/reports/export/group-standings/jobs",
+            params={"tournament_id": standings_tournament.id},
+        )
+        job_id = response.json()["job_id"]
+
+        monkeypatch.setattr(reports, "EXPORT_JOB_TTL_SECONDS", -1)
+
+        response = client.get(f"/api/reports/export/jobs/{job_id}")
+
+        assert response.status_code == 404
+        assert job_id not in reports._export_jobs
+
+
+class TestTournamentSummaryAPI:
+    """大会サマリーAPIのテスト"""
+
+    def test_summary_counts_by_stage_and_status(
+        self, client: TestClient, test_session: Session
+    ):
+        """正常系: ステージ別試合数・完了数・完了率を集計する"""
+        tournament = create_test_tournament(test_session)
+        create_test_group(test_session, tournament.id)
+        teams = create_test_teams(test_session, tournament.id)
+        venue = create_test_venue(test_session, tournament.id)
+
+        # 予選3試合（うち完了2）、準決勝1試合（完了）、決勝1試合（予定）
+        seeds = [
+            (MatchStage.FINAL, MatchStatus.SCHEDULED),
+            (MatchStage.PRELIMINARY, MatchStatus.COMPLETED),
+            (MatchStage.PRELIMINARY, MatchStatus.COMPLETED),
+            (MatchStage.PRELIMINARY, MatchStatus.SCHEDULED),
+            (MatchStage.SEMIFINAL, MatchStatus.COMPLETED),
+        ]
+        for order, (stage, match_status) in enumerate(seeds, start=1):
+            create_test_match(
+                test_session, tournament.id, venue.id, teams,
+                stage, match_status, match_order=order,
+            )
+
+        response = client.get(f"/api/reports/summary/{tournament.id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["tournament_id"] == tournament.id
+        assert data["tournament_name"] == "テスト大会"
+        assert data["team_count"] == 2
+        assert data["total_matches"] == 5
+        assert data["completed_matches"] == 3
+        assert data["completion_rate"] == 60.0
+        # MatchStageの定義順で、試合のないステージは含まない
+        assert list(data["stage_counts"].items()) == [
+            ("preliminary", 3),
+            ("semifinal", 1),
+            ("final", 1),
+        ]
+
+    def test_summary_goals_exclude_other_tournaments(
+        self, client: TestClient, test_session: Session
+    ):
+        """総得点は対象大会の試合の得点のみを数える"""
+        tournament = create_test_tournament(test_session)
+        other = create_test_tournament(test_session, name="別大会")
+
+        for target, goal_counts in ((tournament, (2, 1)), (other, (4,))):
+            create_test_group(test_session, target.id)
+            teams = create_test_teams(test_session, target.id)
+            venue = create_test_venue(test_session, target.id)
+            for order, count in enumerate(goal_counts, start=1):
+                match = create_test_match(
+                    test_session, target.id, venue.id, teams,
+                    MatchStage.PRELIMINARY, MatchStatus.COMPLETED, match_order=order,
+                )
+                create_test_goals(test_session, match, count)
+
+        response = client.get(f"/api/reports/summary/{tournament.id}")
+        assert response.status_code == 200
+        assert response.json()["total_goals"] == 3
+
+        response = client.get(f"/api/reports/summary/{other.id}")
+        assert response.status_code == 200
+        assert response.json()["total_goals"] == 4
+
+    def test_summary_without_matches(self, client: TestClient, test_session: Session):
+        """試合がない大会は件数0・完了率0"""
+        tournament = create_test_tournament(test_session)
+
+        response = client.get(f"/api/reports/summary/{tournament.id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_matches"] == 0
+        assert data["completed_matches"] == 0
+        assert data["completion_rate"] == 0
+        assert data["stage_counts"] == {}
+        assert data["total_goals"] == 0
+
+    def test_summary_tournament_not_found(self, client: TestClient):
+        """異常系: 存在しない大会は404"""
+        response = client.get("/api/reports/summary/9999")
+
+        assert response.status_code == 404